@@ -2,44 +2,126 @@ import pygame
 import random
 import sys
 import os
+import socket
 import screeninfo
 import math
 import configparser # Added for reading the config file
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from functools import lru_cache
+import numpy as np
+
+# Numba is optional. Without it, @njit functions simply run as plain Python.
+try:
+    import numba
+    _HAS_NUMBA = True
+
+    # Numba keys its on-disk cache on the .py source, which a PyInstaller bundle
+    # (or any sourceless .pyc) doesn't have; there, cache=True fails at import.
+    _NUMBA_CAN_CACHE = not getattr(sys, 'frozen', False) and __file__.endswith('.py') and os.path.isfile(__file__)
+
+    def njit(*args, **kwargs):
+        """numba.njit, compiling without the on-disk cache when there is no source to key it on."""
+        if not _NUMBA_CAN_CACHE:
+            kwargs['cache'] = False
+        return numba.njit(*args, **kwargs)
+except ImportError:
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba isn't installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# The SDL2 renderer backend is optional (pygame's _sdl2 module is experimental).
+try:
+    from pygame._sdl2.video import Window, Renderer, Texture, WINDOWPOS_UNDEFINED
+    _HAS_SDL2_RENDERER = True
+except ImportError:
+    _HAS_SDL2_RENDERER = False
 
 # --- macOS Desktop Level Support ---
-def get_all_displays_rect():
-    """Get the bounding rectangle covering all displays using PyObjC NSScreen (more reliable than screeninfo)."""
+# PyObjC is optional. Import it once here so the helpers below don't pay for
+# the import machinery (and an ImportError handler) on every call.
+try:
+    from AppKit import NSApplication, NSScreen, NSApplicationDidChangeScreenParametersNotification
+    from Cocoa import NSWindowCollectionBehaviorCanJoinAllSpaces, NSWindowCollectionBehaviorStationary
+    from Foundation import NSMakeRect, NSNotificationCenter
+    _HAS_APPKIT = True
+except ImportError:
+    _HAS_APPKIT = False
+
+# NSScreen queries cross the PyObjC bridge on every attribute access, so the
+# bounding rect is cached briefly and dropped whenever the display setup changes.
+DISPLAY_RECT_CACHE_TTL_S = 0.5
+_display_rect_cache = {"rect": None, "t": None, "observer": None}
+
+def _invalidate_display_rect_cache(notification=None):
+    """Forget the cached display rect (displays were added, removed or rearranged)."""
+    _display_rect_cache["t"] = None
+
+def _watch_screen_parameters():
+    """Register (once) for screen configuration changes to invalidate the display rect cache."""
+    if _display_rect_cache["observer"] is not None:
+        return
+    _display_rect_cache["observer"] = NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+        NSApplicationDidChangeScreenParametersNotification, None, None, _invalidate_display_rect_cache
+    )
+
+def _screens_bounds(screens):
+    """Single pass over NSScreens returning (min_x, min_y, max_x, max_y), one frame() call per screen."""
+    min_x = min_y = float('inf')
+    max_x = max_y = float('-inf')
+    for screen in screens:
+        f = screen.frame()
+        origin, size = f.origin, f.size
+        x0, y0 = origin.x, origin.y
+        x1, y1 = x0 + size.width, y0 + size.height
+        if x0 < min_x: min_x = x0
+        if x1 > max_x: max_x = x1
+        if y0 < min_y: min_y = y0
+        if y1 > max_y: max_y = y1
+    return min_x, min_y, max_x, max_y
+
+def _compute_all_displays_rect():
+    if not _HAS_APPKIT:
+        return None
     try:
-        from AppKit import NSScreen
+        _watch_screen_parameters()
         screens = NSScreen.screens()
         if not screens:
             return None
-        
+
         # Get the bounding box of all screens
         # Note: macOS uses bottom-left origin, but we need top-left for SDL
-        min_x = min(screen.frame().origin.x for screen in screens)
-        max_x = max(screen.frame().origin.x + screen.frame().size.width for screen in screens)
-        
-        # For Y, macOS origin is bottom-left, so we need to find the visual top-left
-        min_y = min(screen.frame().origin.y for screen in screens)
-        max_y = max(screen.frame().origin.y + screen.frame().size.height for screen in screens)
-        
+        min_x, min_y, max_x, max_y = _screens_bounds(screens)
+
         width = max_x - min_x
         height = max_y - min_y
-        
+
         return (int(min_x), int(min_y), int(width), int(height))
-    except ImportError:
-        return None
     except Exception as e:
         print(f"Could not get display rect: {e}")
         return None
 
+def get_all_displays_rect():
+    """Get the bounding rectangle covering all displays using PyObjC NSScreen (more reliable than screeninfo)."""
+    now = time.monotonic()
+    cached_at = _display_rect_cache["t"]
+    if cached_at is not None and now - cached_at < DISPLAY_RECT_CACHE_TTL_S:
+        return _display_rect_cache["rect"]
+    _display_rect_cache["rect"] = _compute_all_displays_rect()
+    _display_rect_cache["t"] = now
+    return _display_rect_cache["rect"]
+
 def set_wallpaper_mode():
     """Send the pygame window to the desktop level (behind all windows) on macOS."""
+    if not _HAS_APPKIT:
+        print("Note: AppKit not available. Install pyobjc for wallpaper mode: pip install pyobjc")
+        return False
     try:
-        from AppKit import NSApplication, NSWindow
-        from Cocoa import NSWindowCollectionBehaviorCanJoinAllSpaces, NSWindowCollectionBehaviorStationary
-        
         app = NSApplication.sharedApplication()
         for window in app.windows():
             # kCGDesktopWindowLevel = -2147483623 (desktop level)
@@ -52,28 +134,21 @@ def set_wallpaper_mode():
             # Prevent it from appearing in Mission Control
             window.setCanHide_(False)
         return True
-    except ImportError:
-        print("Note: AppKit not available. Install pyobjc for wallpaper mode: pip install pyobjc")
-        return False
     except Exception as e:
         print(f"Could not enable wallpaper mode: {e}")
         return False
 
 def reposition_window_to_all_displays():
     """After pygame window is created, reposition it to cover all displays using PyObjC."""
+    if not _HAS_APPKIT:
+        return False
     try:
-        from AppKit import NSApplication, NSScreen
-        from Foundation import NSMakeRect
-        
         screens = NSScreen.screens()
         if not screens:
             return False
         
         # Calculate bounding box of all screens
-        min_x = min(screen.frame().origin.x for screen in screens)
-        max_x = max(screen.frame().origin.x + screen.frame().size.width for screen in screens)
-        min_y = min(screen.frame().origin.y for screen in screens)
-        max_y = max(screen.frame().origin.y + screen.frame().size.height for screen in screens)
+        min_x, min_y, max_x, max_y = _screens_bounds(screens)
         
         width = max_x - min_x
         height = max_y - min_y
@@ -89,41 +164,99 @@ def reposition_window_to_all_displays():
         print(f"Could not reposition window: {e}")
         return False
 
-def resource_path(relative_path):
-    """ Get absolute path to resource, works for dev and for PyInstaller. """
+def signal_launcher_ready(ready_fd):
+    """Tells the launcher, over the socket it passed in as --ready-fd, that this window is placed."""
     try:
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+        with socket.socket(fileno=ready_fd) as sock:
+            sock.sendall(b"ready\n")
+    except OSError as e:
+        print(f"Could not signal the launcher: {e}")
+
+# PyInstaller unpacks bundled resources to sys._MEIPASS; in dev they live in the working directory.
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
 
+@lru_cache(maxsize=None)
+def resource_path(relative_path):
+    """ Get absolute path to resource, works for dev and for PyInstaller. """
+    return os.path.join(_BASE_PATH, relative_path)
+
+@njit(cache=True, inline='always')
+def _quantize_one(r, g, b, step):
+    """Rounds each channel to the nearest multiple of step, clamped to 0-255."""
+    half = step >> 1
+    if step & (step - 1) == 0:
+        # Power-of-two step: rounding down to a multiple of step is a single AND.
+        mask = -step
+        rq = (r + half) & mask
+        gq = (g + half) & mask
+        bq = (b + half) & mask
+    else:
+        rq = ((r + half) // step) * step
+        gq = ((g + half) // step) * step
+        bq = ((b + half) // step) * step
+    # Clamp the FINAL values to the valid 0-255 range to prevent the ValueError.
+    if rq > 255: rq = 255
+    if gq > 255: gq = 255
+    if bq > 255: bq = 255
+    return rq, gq, bq
+
+@njit(cache=True)
+def _quantize_batch_kernel(colors, step):
+    out = np.empty(colors.shape, dtype=np.uint8)
+    for i in range(colors.shape[0]):
+        rq, gq, bq = _quantize_one(colors[i, 0], colors[i, 1], colors[i, 2], step)
+        out[i, 0] = rq
+        out[i, 1] = gq
+        out[i, 2] = bq
+    return out
+
+# Quantization lookup tables, one per step. Built lazily, since the step
+# only changes when config.ini does.
+_QUANT_LUTS = {}
+
+def _get_quant_lut(step):
+    """Returns the 256-entry quantization table for a step."""
+    table = _QUANT_LUTS.get(step)
+    if table is None:
+        table = np.array([_quantize_one(i, i, i, step)[0] for i in range(256)], dtype=np.uint8)
+        _QUANT_LUTS[step] = table
+    return table
+
+@lru_cache(maxsize=4096)
 def quantize_color(color, step=16):
     """
     Snaps a color to a limited palette to improve cache performance.
     A larger step is faster but has more visible color banding.
+    Results are memoized, so color must be hashable (a tuple).
     """
     try:
-        r, g, b = color
+        r, g, b = (max(0, min(255, int(c))) for c in color)
     except (TypeError, ValueError):
         # Failsafe in case the incoming color is somehow invalid.
-        return (0, 255, 0) 
+        return (0, 255, 0)
 
-    # Quantize each component
-    r_quant = int(round(r / step)) * step
-    g_quant = int(round(g / step)) * step
-    b_quant = int(round(b / step)) * step
+    return tuple(int(v) for v in _get_quant_lut(step)[[r, g, b]])
 
-    # Clamp the FINAL values to the valid 0-255 range to prevent the ValueError.
-    # This is the critical fix.
-    return (
-        max(0, min(255, r_quant)),
-        max(0, min(255, g_quant)),
-        max(0, min(255, b_quant))
-    )
+def quantize_colors_batch(colors_u8, step=16):
+    """
+    Vectorized quantize_color for an (N, 3) array of colors in the 0-255 range.
+    Quantizes a whole column's worth of colors in a single call.
+    Without numba this is a table gather, which beats NumPy's bitwise
+    ops even for power-of-two steps.
+    """
+    if _HAS_NUMBA:
+        return _quantize_batch_kernel(np.asarray(colors_u8, dtype=np.int64), step)
+    return _get_quant_lut(step)[np.asarray(colors_u8, dtype=np.intp)]
+
+if _HAS_NUMBA:
+    # Compile (or load from the on-disk cache) now rather than stalling the first frame.
+    _quantize_batch_kernel(np.zeros((1, 3), dtype=np.int64), 16)
 
 # --- General Configuration ---
 # NOTE: These are now DEFAULTS. They will be overridden by config.ini
 FRAME_RATE = 60
+WALLPAPER_MAX_FRAME_RATE = 30  # Nobody watches a wallpaper closely; save the power
+FPS_CAPTION_INTERVAL_S = 1.0  # Setting the window title is a window-server round trip
 BACKGROUND_COLOR = (0, 0, 0)
 FONT_STRETCH_FACTOR = 1.25
 
@@ -195,15 +328,90 @@ FG_SECOND_CHAR_COLOR = (80, 255, 160)  # Canon: bright cyan-green just behind le
 FG_SECOND_CHAR_GRADIENT_RANGE = (0, 10)
 
 
-# This will be set from config.ini
+# Default; config.ini overrides it (see RainConfig)
 COLOR_QUANTIZATION_STEP = 16
 
+
+@dataclass(frozen=True, slots=True)
+class RainConfig:
+    """Runtime settings from config.ini. Defaults mirror the module constants above."""
+    frame_rate: int = FRAME_RATE
+    background_color: tuple = BACKGROUND_COLOR
+    font_stretch_factor: float = FONT_STRETCH_FACTOR
+    ripples_enabled: bool = True
+    cascades_enabled: bool = True
+    haze_enabled: bool = HAZE_ENABLED
+    crt_grid_enabled: bool = CRT_GRID_ENABLED
+    fg_spacing: int = FG_STREAM_SPACING
+    color_quantization_step: int = COLOR_QUANTIZATION_STEP
+    adaptive_threshold: int = 45
+    wallpaper_mode: bool = False
+    gpu_renderer: bool = False
+
+    @classmethod
+    def from_ini(cls, path):
+        """
+        Reads the [Settings] section in one pass, falling back to the defaults on any error.
+        The optional settings are read on their own, so they apply even when the rest fails.
+        """
+        parser = configparser.ConfigParser()
+        try:
+            parser.read(path)
+        except configparser.Error as e:
+            print(f"Could not read config.ini, using default settings. Error: {e}")
+            return cls()
+
+        optional = {}
+        for field_name, key in (('wallpaper_mode', 'WallpaperMode'), ('gpu_renderer', 'GpuRenderer')):
+            try:
+                optional[field_name] = parser.getboolean('Settings', key, fallback=False)
+            except ValueError:
+                optional[field_name] = False
+
+        try:
+            # Unlike a section proxy's, these raise on a missing key
+            step = parser.getint('Settings', 'ColorQuantizationStep')
+            if not 1 <= step <= 255:
+                print(f"ColorQuantizationStep must be between 1 and 255, got {step}; using {COLOR_QUANTIZATION_STEP}")
+                step = COLOR_QUANTIZATION_STEP
+            frame_rate = parser.getint('Settings', 'TargetFPS')
+            if frame_rate <= 0:
+                # Frames are paced by a timer, so there is no uncapped mode
+                print(f"TargetFPS must be a positive number of frames per second, got {frame_rate}; using {FRAME_RATE}")
+                frame_rate = FRAME_RATE
+            return cls(
+                ripples_enabled=parser.getboolean('Settings', 'EnableRipples'),
+                cascades_enabled=parser.getboolean('Settings', 'EnableCascades'),
+                haze_enabled=parser.getboolean('Settings', 'EnableHaze'),
+                crt_grid_enabled=parser.getboolean('Settings', 'EnableCrtGrid'),
+                fg_spacing=parser.getint('Settings', 'ForegroundSpacing'),
+                color_quantization_step=step,
+                frame_rate=frame_rate,
+                adaptive_threshold=parser.getint('Settings', 'AdaptiveThreshold'),
+                **optional,
+            )
+        except Exception as e:
+            print(f"Could not read config.ini, using default settings. Error: {e}")
+            return cls(**optional)
+
 class FontCache:
-    def __init__(self, font, char_list, stretch_factor=1.0):
+    # Above this many (glyph, color) slots the surface table falls back to the dict
+    MAX_TABLE_SLOTS = 1 << 21
+    # The dict fallback is an LRU capped at this many tinted surfaces
+    MAX_COLOR_CACHE_ENTRIES = 4096
+    # Glyph variants: trail glyphs, and leaders with LEADER_EXTRA_BOLDNESS baked in
+    BODY = 0
+    LEADER = 1
+
+    def __init__(self, font, char_list, stretch_factor=1.0, step=16, is_bold=False):
         self.font = font
         self.stretch_factor = stretch_factor
+        self.char_list = char_list
         self.master_cache = {}
-        self.color_cache = {}
+        self.leader_master_cache = {}
+        self.color_cache = OrderedDict()
+        self.evicted_surfaces = []  # Evicted from color_cache, but maybe still queued for a blit
+        self.spare_surfaces = []  # Evicted and flushed, free to redraw
 
         for char in set(char_list):
             master_surface = font.render(char, True, (255, 255, 255))
@@ -216,28 +424,132 @@ class FontCache:
             else:
                 self.master_cache[char] = master_surface
 
-    def get_surface(self, char, color):
-        if (char, color) in self.color_cache:
-            return self.color_cache[(char, color)]
-        
-        master_surface = self.master_cache.get(char)
+        # Bake the bold passes into the masters, so every glyph is a single blit.
+        # Bold glyphs are the base plus a copy 1px right; leaders add the
+        # LEADER_EXTRA_BOLDNESS copies, alternating right and left of it.
+        body_offsets = [0, 1] if is_bold else [0]
+        leader_offsets = list(body_offsets)
+        for i in range(LEADER_EXTRA_BOLDNESS):
+            offset = (i // 2) + 1
+            leader_offsets.append(body_offsets[-1] + offset if i % 2 == 0 else -offset)
+        # Leader surfaces start this far left of the glyph origin
+        self.leader_offset_x = min(leader_offsets)
+        for char, master_surface in list(self.master_cache.items()):
+            self.master_cache[char] = self._composite(master_surface, body_offsets)
+            self.leader_master_cache[char] = self._composite(master_surface, leader_offsets)
+        self.variant_masters = (self.master_cache, self.leader_master_cache)
+        self.max_glyph_width = max(surface.get_width() for masters in self.variant_masters for surface in masters.values())
+
+        # Integer-indexed surface table: slot = (variant * num_glyphs + glyph_id) * num_colors + color_id,
+        # where color_id packs the quantization level of each channel. Duplicate chars in
+        # char_list share a glyph_id, so they share surfaces.
+        self.unique_chars = list(dict.fromkeys(char_list))
+        self.glyph_ids = np.array([self.unique_chars.index(c) for c in char_list], dtype=np.intp)
+        levels = np.unique(_get_quant_lut(step))
+        self.level_ids = np.zeros(256, dtype=np.intp)
+        self.level_ids[levels] = np.arange(len(levels))
+        self.level_weights = np.array([len(levels) ** 2, len(levels), 1], dtype=np.intp)
+        self.num_colors = len(levels) ** 3
+        num_slots = len(self.variant_masters) * len(self.unique_chars) * self.num_colors
+        self.surface_table = [None] * num_slots if num_slots <= self.MAX_TABLE_SLOTS else None
+
+    @staticmethod
+    def _composite(master_surface, offsets):
+        """BLEND_RGBA_MAX of master_surface at each x offset, on a surface just wide enough to hold them."""
+        if offsets == [0]:
+            return master_surface
+        left = min(offsets)
+        width, height = master_surface.get_size()
+        composite = pygame.Surface((width + max(offsets) - left, height), pygame.SRCALPHA)
+        composite.fill((0, 0, 0, 0))
+        for offset in offsets:
+            composite.blit(master_surface, (offset - left, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        return composite
+
+    def _tint(self, char, color, recycled=None, variant=BODY):
+        """Tints the master glyph, drawing into recycled instead of a fresh copy when it's the right size."""
+        # Tinting is monotonic per channel, so tinting a baked composite gives the
+        # same pixels as compositing tinted copies.
+        master_surface = self.variant_masters[variant].get(char)
         if not master_surface:
             return self.font.render(char, True, color)
-            
+        if recycled is not None and recycled.get_size() == master_surface.get_size():
+            # MULT is symmetric, so color * master gives the same pixels as master * color
+            recycled.fill(color)
+            recycled.blit(master_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            return recycled
         tinted_surface = master_surface.copy()
         tinted_surface.fill(color, special_flags=pygame.BLEND_RGBA_MULT)
-        self.color_cache[(char, color)] = tinted_surface
         return tinted_surface
 
+    def surfaces_for(self, char_indices, colors, variant=BODY):
+        """
+        Surfaces for a run of glyphs: char_indices index char_list, colors is an
+        (N, 3) uint8 array already quantized with this cache's step.
+        LEADER surfaces are drawn leader_offset_x left of the glyph origin.
+        """
+        table = self.surface_table
+        if table is None:
+            char_list = self.char_list
+            return [
+                self.get_surface(char_list[char_index], (r, g, b), variant)
+                for char_index, (r, g, b) in zip(char_indices.tolist(), colors.tolist())
+            ]
+
+        glyph_slots = self.glyph_ids[char_indices] + variant * len(self.unique_chars)
+        slots = (glyph_slots * self.num_colors + self.level_ids[colors] @ self.level_weights).tolist()
+        surfaces = [table[slot] for slot in slots]
+        if None in surfaces:
+            char_list = self.char_list
+            for i, slot in enumerate(slots):
+                if surfaces[i] is None:
+                    if table[slot] is None:
+                        table[slot] = self._tint(char_list[char_indices[i]], tuple(colors[i].tolist()), variant=variant)
+                    surfaces[i] = table[slot]
+        return surfaces
+
+    def get_surface(self, char, color, variant=BODY):
+        # Colors are quantized, so (char, color) pairs are bounded; the LRU
+        # cap only matters for very fine steps, where the table is too big.
+        key = (char, color, variant)
+        color_cache = self.color_cache
+        cached_surface = color_cache.get(key)
+        if cached_surface is not None:
+            color_cache.move_to_end(key)
+            return cached_surface
+
+        # Once full, the least recently used surface is evicted. Backends queue their
+        # blits until the end of the frame, so it may still be waiting to be drawn;
+        # it is only redrawn for a new key after release_evicted(), and until then
+        # misses redraw an earlier frame's evictions, so steady-state misses don't allocate.
+        if len(color_cache) >= self.MAX_COLOR_CACHE_ENTRIES:
+            self.evicted_surfaces.append(color_cache.popitem(last=False)[1])
+        recycled = self.spare_surfaces.pop() if self.spare_surfaces else None
+        tinted_surface = self._tint(char, color, recycled, variant)
+        color_cache[key] = tinted_surface
+        return tinted_surface
+
+    def release_evicted(self):
+        """Call once the queued blits have been flushed: the surfaces evicted so far become free to redraw."""
+        if self.evicted_surfaces:
+            self.spare_surfaces.extend(self.evicted_surfaces)
+            self.evicted_surfaces.clear()
+
+    def prewarm(self, colors, variant=BODY):
+        """Tint every glyph in each color up front, so early frames don't stall on cache misses."""
+        colors = np.array(list(colors), dtype=np.uint8).reshape(-1, 3)
+        first_indices = np.array([self.char_list.index(c) for c in self.unique_chars], dtype=np.intp)
+        self.surfaces_for(np.tile(first_indices, len(colors)), np.repeat(colors, len(first_indices), axis=0), variant)
+
 class HighlightCascade:
-    def __init__(self, origin_x, origin_y, is_dark):
+    def __init__(self, origin_x, origin_y, is_dark, num_columns):
         self.origin_x = origin_x
         self.origin_y = origin_y
         self.is_dark = is_dark
         self.current_radius = 0.0
         self.speed = CASCADE_RADIUS_PPS
         self.max_radius = CASCADE_MAX_RADIUS
-        self.triggered_columns = set()
+        self.triggered = np.zeros(num_columns, dtype=np.bool_)  # Indexed like HighlightCascadeManager.all_columns
 
 class Ripple:
     def __init__(self, origin_x, origin_y):
@@ -248,6 +560,7 @@ class Ripple:
         self.speed = RIPPLE_RADIUS_PPS
         self.max_radius = RIPPLE_MAX_RADIUS
         self.distortion_phase = 0.0 # For pre-calculation
+        self.distortion_lut = None
         
         base_color = FG_LEADER_COLOR
         brightness = RIPPLE_BRIGHTNESS_BOOST
@@ -259,18 +572,15 @@ class Ripple:
         self.target_color = (int(r), int(g), int(b))
 
 
-def distance_sq_point_to_vertical_segment(px, py, seg_x, seg_y1, seg_y2):
-    if seg_y1 > seg_y2:
-        seg_y1, seg_y2 = seg_y2, seg_y1
-    qx = seg_x
-    qy = max(seg_y1, min(py, seg_y2))
-    return (px - qx)**2 + (py - qy)**2
-
 class HighlightCascadeManager:
     def __init__(self, column_layers):
         self.column_layers = column_layers
         self.all_columns = [col for layer in self.column_layers for col in layer]
         self.active_cascades = []
+        # Static per-column geometry; the moving parts are re-read each frame in update()
+        self.xs = np.array([col.x for col in self.all_columns], dtype=np.float64)
+        self.line_heights = np.array([col.line_height for col in self.all_columns], dtype=np.float64)
+        self.num_chars = np.array([col.num_chars for col in self.all_columns], dtype=np.int64)
 
     def _start_new_cascade(self):
         eligible_columns = [
@@ -284,40 +594,67 @@ class HighlightCascadeManager:
         origin_y = start_column.leader_pos_float * start_column.line_height
 
         is_dark_cascade = random.random() < DARK_CASCADE_CHANCE
-        self.active_cascades.append(HighlightCascade(origin_x, origin_y, is_dark_cascade))
+        self.active_cascades.append(HighlightCascade(origin_x, origin_y, is_dark_cascade, len(self.all_columns)))
 
     def update(self, delta_time):
         if random.random() < CASCADE_CHANCE_PER_SECOND * delta_time:
             self._start_new_cascade()
 
-        for cascade in self.active_cascades[:]:
+        if not self.active_cascades:
+            return
+
+        columns = self.all_columns
+        layers = self.column_layers
+        leader_ints = np.concatenate([layer.leader_pos_float for layer in layers]).astype(np.int64)
+        trail_lengths = np.concatenate([layer.trail_length for layer in layers])
+        dormant = np.concatenate([layer.dormant_counter for layer in layers])
+
+        # Columns a cascade could trigger at all this frame, and their streak extents
+        eligible = (dormant <= 0) & (trail_lengths > 1) & (leader_ints >= 0) & (leader_ints < self.num_chars)
+        trail_top_ys = (leader_ints - trail_lengths + 1) * self.line_heights
+        trail_bottom_ys = leader_ints * self.line_heights
+
+        for cascade in self.active_cascades:
             cascade.current_radius += cascade.speed * delta_time
             cascade_radius_sq = cascade.current_radius * cascade.current_radius
 
-            for column in self.all_columns:
-                if abs(cascade.origin_x - column.x) > cascade.current_radius:
-                    continue
-
-                if column in cascade.triggered_columns or column.dormant_counter > 0 or column.trail_length <= 1:
-                    continue
-                leader_pos_int = int(column.leader_pos_float)
-                if not (0 <= leader_pos_int < column.num_chars):
-                    continue
-                trail_top_y = (leader_pos_int - column.trail_length + 1) * column.line_height
-                trail_bottom_y = leader_pos_int * column.line_height
-                dist_sq_to_streak = distance_sq_point_to_vertical_segment(
-                    cascade.origin_x, cascade.origin_y, column.x, trail_top_y, trail_bottom_y
-                )
-                if dist_sq_to_streak <= cascade_radius_sq:
-                    column.trigger_cascade(cascade.origin_y, cascade.is_dark)
-                    cascade.triggered_columns.add(column)
+            dx = self.xs - cascade.origin_x
+            # Distance from the cascade origin to each streak, as a vertical segment
+            qy = np.clip(cascade.origin_y, trail_top_ys, trail_bottom_ys)
+            dy = cascade.origin_y - qy
+            dist_sq_to_streak = dx * dx + dy * dy
+            hits = (
+                eligible & ~cascade.triggered
+                & (np.abs(dx) <= cascade.current_radius)
+                & (dist_sq_to_streak <= cascade_radius_sq)
+            )
+            for i in np.flatnonzero(hits).tolist():
+                columns[i].trigger_cascade(cascade.origin_y, cascade.is_dark)
+            cascade.triggered |= hits
+
+        self.active_cascades = [c for c in self.active_cascades if c.current_radius <= c.max_radius]
+
+# Packed ripple rows: origin_x, origin_y, current_radius, age, distortion_phase, target r, g, b
+RIPPLE_ARRAY_COLUMNS = 8
+NO_RIPPLES = np.zeros((0, RIPPLE_ARRAY_COLUMNS), dtype=np.float32)
+
+# Ripple distortion is sampled from a per-ripple sine table indexed by angle
+RIPPLE_DISTORTION_LUT_SIZE = 1024
+NO_RIPPLE_LUTS = np.zeros((0, RIPPLE_DISTORTION_LUT_SIZE), dtype=np.float32)
+_LUT_ANGLES = np.linspace(-math.pi, math.pi, RIPPLE_DISTORTION_LUT_SIZE, endpoint=False)
 
-            if cascade.current_radius > cascade.max_radius:
-                self.active_cascades.remove(cascade)
+# Ripples are bucketed by the screen x range they can reach, so a column only
+# looks at ripples from its own bucket instead of every active one
+RIPPLE_BUCKET_WIDTH = 64
+NO_RIPPLE_INDICES = np.zeros(0, dtype=np.intp)
+NO_RIPPLE_BUCKETS = ()
 
 class RippleManager:
     def __init__(self, screen_width, screen_height):
         self.active_ripples = []
+        self.ripple_array = NO_RIPPLES
+        self.ripple_luts = NO_RIPPLE_LUTS
+        self.ripple_buckets = NO_RIPPLE_BUCKETS
         self.screen_width = screen_width
         self.screen_height = screen_height
 
@@ -330,40 +667,378 @@ class RippleManager:
         if random.random() < RIPPLE_CHANCE_PER_SECOND * delta_time:
             self._start_new_ripple()
 
-        for ripple in self.active_ripples[:]:
+        for ripple in self.active_ripples:
             ripple.age += delta_time
             ripple.current_radius += ripple.speed * delta_time
             ripple.distortion_phase = ripple.age * RIPPLE_DISTORTION_SPEED
-            
-            total_lifetime = (RIPPLE_FADE_IN_TIME_MS / 1000.0) + RIPPLE_FADE_OUT_TIME_S
-            if ripple.age > total_lifetime or ripple.current_radius > ripple.max_radius:
-                self.active_ripples.remove(ripple)
+            # Entry k is the radius distortion at angle -pi + k * (2*pi / RIPPLE_DISTORTION_LUT_SIZE)
+            ripple.distortion_lut = (
+                np.sin(_LUT_ANGLES * RIPPLE_DISTORTION_FREQUENCY + ripple.distortion_phase) * RIPPLE_DISTORTION_AMPLITUDE
+            ).astype(np.float32)
+
+        total_lifetime = (RIPPLE_FADE_IN_TIME_MS / 1000.0) + RIPPLE_FADE_OUT_TIME_S
+        self.active_ripples = [
+            r for r in self.active_ripples
+            if r.age <= total_lifetime and r.current_radius <= r.max_radius
+        ]
+        self._pack_ripples()
+
+    def _pack_ripples(self):
+        """Rebuilds ripple_array, ripple_luts and ripple_buckets, the contiguous copies of the ripples that columns read."""
+        if not self.active_ripples:
+            self.ripple_array = NO_RIPPLES
+            self.ripple_luts = NO_RIPPLE_LUTS
+            self.ripple_buckets = NO_RIPPLE_BUCKETS
+            return
+        self.ripple_array = np.array([
+            (r.origin_x, r.origin_y, r.current_radius, r.age, r.distortion_phase, *r.target_color)
+            for r in self.active_ripples
+        ], dtype=np.float32)
+        self.ripple_luts = np.stack([r.distortion_lut for r in self.active_ripples])
+
+        # Bucket b lists every ripple whose bounding box overlaps x in [b * W, (b + 1) * W)
+        num_buckets = self.screen_width // RIPPLE_BUCKET_WIDTH + 1
+        reach = self.ripple_array[:, 2] + RIPPLE_DISTORTION_AMPLITUDE
+        first = np.clip((self.ripple_array[:, 0] - reach) // RIPPLE_BUCKET_WIDTH, 0, num_buckets - 1).astype(np.intp)
+        last = np.clip((self.ripple_array[:, 0] + reach) // RIPPLE_BUCKET_WIDTH, 0, num_buckets - 1).astype(np.intp)
+        buckets = [[] for _ in range(num_buckets)]
+        for k, (first_bucket, last_bucket) in enumerate(zip(first.tolist(), last.tolist())):
+            for bucket in range(first_bucket, last_bucket + 1):
+                buckets[bucket].append(k)
+        self.ripple_buckets = tuple(np.array(b, dtype=np.intp) if b else NO_RIPPLE_INDICES for b in buckets)
 
     def get_active_ripples(self):
         return self.active_ripples
 
+    def get_ripple_arrays(self):
+        return self.ripple_array, self.ripple_luts, self.ripple_buckets
+
+
+def build_fade_palette(head_color, second_color, trail_color, length, step=16):
+    """
+    Builds a streak's full trail gradient, already quantized, as an (length, 3) uint8 array.
+    Index 0 is the leader; the palette only has to be rebuilt when a streak resets.
+    """
+    colors = []
+
+    # Canon: ultra-smooth gradient with 5 color stops
+    # Create intermediate colors for smoother transitions
+    mid_bright = (
+        (second_color[0] + trail_color[0]) // 2,
+        (second_color[1] + trail_color[1]) // 2,
+        (second_color[2] + trail_color[2]) // 2
+    )
+    dark_green = (
+        trail_color[0] // 2,
+        trail_color[1] // 2,
+        trail_color[2] // 2
+    )
+    
+    # Color stops: position -> color
+    color_stops = [
+        (0.0, head_color),              # Leader: white
+        (0.02, second_color),           # Char 1-2: immediate bright green
+        (0.15, second_color),           # Hold bright green
+        (0.30, mid_bright),             # Transition through mid
+        (0.50, trail_color),            # Main trail color
+        (0.75, dark_green),             # Darker green
+        (1.0, (0, 0, 0))                # Fade to black
+    ]
+    
+    for i in range(length):
+        position = i / max(1, length - 1)
+        
+        if i == 0:
+            # Leader stays pure white
+            color = head_color
+        else:
+            # Find which two stops we're between
+            start_stop = color_stops[0]
+            end_stop = color_stops[-1]
+            
+            for j in range(len(color_stops) - 1):
+                if color_stops[j][0] <= position <= color_stops[j + 1][0]:
+                    start_stop = color_stops[j]
+                    end_stop = color_stops[j + 1]
+                    break
+            
+            # Interpolate between stops with smoothstep for extra smoothness
+            if end_stop[0] > start_stop[0]:
+                t = (position - start_stop[0]) / (end_stop[0] - start_stop[0])
+                # Smoothstep interpolation for silky transitions
+                t = t * t * (3 - 2 * t)
+            else:
+                t = 1.0
+            
+            start_color = start_stop[1]
+            end_color = end_stop[1]
+            r = int(start_color[0] + (end_color[0] - start_color[0]) * t)
+            g = int(start_color[1] + (end_color[1] - start_color[1]) * t)
+            b = int(start_color[2] + (end_color[2] - start_color[2]) * t)
+            color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
+        
+        colors.append(color)
+
+    return quantize_colors_batch(np.array(colors, dtype=np.int64).reshape(-1, 3), step=step)
+
+
+@njit(cache=True, inline='always')
+def _ripple_lifecycle_fade(age):
+    """Cubic fade-in over RIPPLE_FADE_IN_TIME_MS, then cubic fade-out over RIPPLE_FADE_OUT_TIME_S."""
+    fade_in_duration_s = RIPPLE_FADE_IN_TIME_MS / 1000.0
+    if age < fade_in_duration_s:
+        p = age / fade_in_duration_s
+    else:
+        p = 1.0 - (age - fade_in_duration_s) / RIPPLE_FADE_OUT_TIME_S
+    p = max(0.0, min(1.0, p))
+    return p * p * p
+
+_LUT_SCALE = RIPPLE_DISTORTION_LUT_SIZE / (2 * math.pi)
+_LUT_MASK = RIPPLE_DISTORTION_LUT_SIZE - 1
+
+@njit(cache=True, fastmath=True)
+def _compute_colors_kernel(leader_pos_int, start, x, y_positions, gradient, ripples, ripple_luts, ripple_indices,
+                           cascade_center, cascade_fade, cascade_color, halo_size, step):
+    n = y_positions.shape[0]
+    colors = np.empty((n, 3), dtype=np.float32)
+    modulated = np.zeros(n, dtype=np.bool_)
+
+    for i in range(n):
+        distance = leader_pos_int - (start + i)
+        r = np.float32(gradient[distance, 0])
+        g = np.float32(gradient[distance, 1])
+        b = np.float32(gradient[distance, 2])
+
+        if cascade_center >= 0:
+            dist_from_hl_center = abs(distance - cascade_center)
+            if dist_from_hl_center <= halo_size:
+                halo_falloff = (halo_size - dist_from_hl_center) / halo_size if halo_size > 0 else 1.0
+                intensity = np.float32(max(0.0, min(1.0, halo_falloff * cascade_fade)))
+                r += (cascade_color[0] - r) * intensity
+                g += (cascade_color[1] - g) * intensity
+                b += (cascade_color[2] - b) * intensity
+                modulated[i] = True
+
+        colors[i, 0] = r
+        colors[i, 1] = g
+        colors[i, 2] = b
+
+    for j in range(ripple_indices.shape[0]):
+        k = ripple_indices[j]
+        origin_x = ripples[k, 0]
+        origin_y = ripples[k, 1]
+        current_radius = ripples[k, 2]
+        max_possible_radius = current_radius + RIPPLE_DISTORTION_AMPLITUDE
+        dx = x - origin_x
+        if abs(dx) > max_possible_radius:
+            continue
+        max_radius_sq = max_possible_radius * max_possible_radius
+        lifecycle_fade = _ripple_lifecycle_fade(ripples[k, 3])
+        lut = ripple_luts[k]
+
+        for i in range(n):
+            dy = y_positions[i] - origin_y
+            if abs(dy) > max_possible_radius:
+                continue
+            dist_sq = dx * dx + dy * dy
+            # No distortion reaches past max_possible_radius; skip the atan2 out there
+            if dist_sq >= max_radius_sq:
+                continue
+            lut_index = int((math.atan2(dy, dx) + math.pi) * _LUT_SCALE) & _LUT_MASK
+            distorted_radius = current_radius + lut[lut_index]
+            distorted_radius_sq = distorted_radius * distorted_radius
+            if dist_sq >= distorted_radius_sq:
+                continue
+            # Falloff in squared distance, so no sqrt per char
+            proximity_fade = 1.0 - dist_sq / distorted_radius_sq if distorted_radius > 0 else 0.0
+            intensity = np.float32(max(0.0, min(1.0, proximity_fade * lifecycle_fade)))
+            for c in range(3):
+                colors[i, c] += (ripples[k, 5 + c] - colors[i, c]) * intensity
+            modulated[i] = True
+
+    out = np.empty((n, 3), dtype=np.uint8)
+    for i in range(n):
+        if modulated[i]:
+            rq, gq, bq = _quantize_one(int(colors[i, 0]), int(colors[i, 1]), int(colors[i, 2]), step)
+            out[i, 0] = rq
+            out[i, 1] = gq
+            out[i, 2] = bq
+        else:
+            # Straight from the gradient, which is already quantized
+            distance = leader_pos_int - (start + i)
+            out[i, 0] = gradient[distance, 0]
+            out[i, 1] = gradient[distance, 1]
+            out[i, 2] = gradient[distance, 2]
+    return out
+
+def _compute_colors_numpy(leader_pos_int, start, x, y_positions, gradient, ripples, ripple_luts, ripple_indices,
+                          cascade_center, cascade_fade, cascade_color, halo_size, step):
+    distances = leader_pos_int - np.arange(start, start + len(y_positions))
+    colors = gradient[distances]
+    modulated = False
+
+    if cascade_center >= 0:
+        dist_from_hl_center = np.abs(distances - cascade_center)
+        in_halo = dist_from_hl_center <= halo_size
+        if in_halo.any():
+            if halo_size > 0:
+                halo_falloff = (halo_size - dist_from_hl_center[in_halo]) / halo_size
+            else:
+                halo_falloff = np.ones(np.count_nonzero(in_halo))
+            final_intensity = np.clip(halo_falloff * cascade_fade, 0.0, 1.0)[:, None]
+
+            colors = colors.astype(np.float32)
+            modulated = True
+            target = np.array(cascade_color, dtype=np.float32)
+            colors[in_halo] += (target - colors[in_halo]) * final_intensity
+
+    if ripple_indices.shape[0]:
+        # Every ripple in the bucket is evaluated against every char in one broadcast;
+        # only the blending below walks the ripples, in order, since each one blends
+        # over the last
+        rows = ripples[ripple_indices]
+        max_possible_radius = rows[:, 2] + RIPPLE_DISTORTION_AMPLITUDE
+        dx = x - rows[:, 0]
+        dy = y_positions[None, :] - rows[:, 1, None]
+        dist_sq = (dx * dx)[:, None] + dy * dy
+        # No distortion reaches past max_possible_radius, so only those (ripple, char)
+        # pairs need the angle lookup
+        ks, chars = np.nonzero(dist_sq < (max_possible_radius * max_possible_radius)[:, None])
+    else:
+        ks = NO_RIPPLE_INDICES
+
+    if ks.shape[0]:
+        intensity = np.zeros(dist_sq.shape, dtype=np.float32)
+        dist_sq = dist_sq[ks, chars]
+        lut_indices = ((np.arctan2(dy[ks, chars], dx[ks]) + math.pi) * _LUT_SCALE).astype(np.intp) & _LUT_MASK
+        distorted_radius = rows[ks, 2] + ripple_luts[ripple_indices[ks], lut_indices]
+        distorted_radius_sq = distorted_radius * distorted_radius
+
+        inside = dist_sq < distorted_radius_sq
+        ks, chars = ks[inside], chars[inside]
+        positive = distorted_radius[inside] > 0
+        radius_sq_in = distorted_radius_sq[inside]
+        proximity_fade = np.where(positive, 1.0 - dist_sq[inside] / np.where(positive, radius_sq_in, 1.0), 0.0)
+        lifecycle_fade = np.array([_ripple_lifecycle_fade(age) for age in rows[:, 3].tolist()], dtype=np.float32)
+        intensity[ks, chars] = np.clip(proximity_fade * lifecycle_fade[ks], 0.0, 1.0)
+
+        if ks.shape[0] and not modulated:
+            colors = colors.astype(np.float32)
+            modulated = True
+        # A zero intensity leaves a char's color exactly as it was
+        for k in np.unique(ks).tolist():
+            colors += (rows[k, 5:8] - colors) * intensity[k, :, None]
+
+    # The gradient is already quantized; only cascade/ripple recoloring needs it.
+    if modulated:
+        colors = quantize_colors_batch(colors.astype(np.int64), step=step)
+    return colors
+
+# compute_colors(leader_pos_int, start, x, y_positions, gradient, ripples, ripple_luts,
+#                ripple_indices, cascade_center, cascade_fade, cascade_color, halo_size, step)
+# Returns the quantized (N, 3) uint8 colors for chars start .. start + N - 1 of a column:
+# the trail gradient with the cascade halo (centered cascade_center chars behind the
+# leader, -1 for none) and the packed ripple rows listed in ripple_indices (distorted by
+# their sine tables) blended in. Compiled by numba when
+# available, otherwise vectorized with NumPy.
+compute_colors = _compute_colors_kernel if _HAS_NUMBA else _compute_colors_numpy
+
+if _HAS_NUMBA:
+    compute_colors(0, 0, 0, np.zeros(1, dtype=np.float32), np.zeros((1, 3), dtype=np.uint8), NO_RIPPLES, NO_RIPPLE_LUTS,
+                   NO_RIPPLE_INDICES, -1, 0.0, (0, 0, 0), 0, 16)
+
+
+def glyph_index_dtype(num_glyphs):
+    """Smallest integer dtype that can index a char list of this length."""
+    return np.int8 if num_glyphs <= np.iinfo(np.int8).max + 1 else np.int16
+
+
+class RandomPool:
+    """
+    Pre-drawn uniform floats and glyph indices, handed out in slices so each
+    column doesn't make its own RNG calls every frame.
+    """
+    def __init__(self, num_glyphs, size=65536):
+        self.num_glyphs = num_glyphs
+        self.size = size
+        self._refill()
+
+    def _refill(self):
+        # Fresh arrays, so slices handed out earlier stay valid
+        self.floats = np.random.random(self.size)
+        self.glyphs = np.random.randint(0, self.num_glyphs, self.size, dtype=glyph_index_dtype(self.num_glyphs))
+        self.pos = 0
+
+    def pop(self, n):
+        """Returns the next n (floats, glyph indices), refilling when the pool runs out."""
+        if self.pos + n > self.size:
+            self.size = max(self.size, n)
+            self._refill()
+        start = self.pos
+        self.pos += n
+        return self.floats[start:self.pos], self.glyphs[start:self.pos]
+
+
+def leader_flicker_interval_s(speed_pps, min_speed_pps, max_speed_pps):
+    """Canon: flicker speed tied to current travel speed. Takes scalars or per-column arrays."""
+    speed_span = max_speed_pps - min_speed_pps
+    normalized_speed = np.where(speed_span > 0, (speed_pps - min_speed_pps) / np.maximum(speed_span, 1e-9), 0.5)
+    curved_speed = np.clip(normalized_speed, 0.0, 1.0) ** FLICKER_SPEED_CURVE_EXPONENT
+    dynamic_interval_ms = (1 - curved_speed) * SLOWEST_LEADER_FLICKER_INTERVAL_MS + curved_speed * FASTEST_LEADER_FLICKER_INTERVAL_MS
+    return dynamic_interval_ms / 1000.0
+
+
+class _LayerArray:
+    """A Column attribute stored in its ColumnLayer's array of the same name."""
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, column, owner=None):
+        if column is None:
+            return self
+        return getattr(column.layer, self.name).item(column.slot)
+
+    def __set__(self, column, value):
+        getattr(column.layer, self.name)[column.slot] = value
+
 
 class Column:
-    def __init__(self, x, screen_height, config):
+    # Trail palettes shared by every column, keyed on everything build_fade_palette reads
+    _gradient_cache = {}
+
+    # Motion state, advanced for the whole layer at once by ColumnLayer.advance
+    dormant_counter = _LayerArray()
+    leader_pos_float = _LayerArray()
+    trail_length = _LayerArray()
+    speed_pps = _LayerArray()
+    speed_cps = _LayerArray()
+    min_speed_pps = _LayerArray()
+    max_speed_pps = _LayerArray()
+    speed_change_timer = _LayerArray()
+    next_speed_change = _LayerArray()
+    leader_flicker_timer = _LayerArray()
+    flicker_interval_s = _LayerArray()
+
+    def __init__(self, x, screen_height, config, layer, slot):
+        self.layer = layer
+        self.slot = slot
         self.x = x
+        self.ripple_bucket = int(x) // RIPPLE_BUCKET_WIDTH
         self.screen_height = screen_height
         self.config = config
         self.font_cache = config['font_cache']
+        self.random_pool = config['random_pool']
         self.font_size = config['font_size']
         self.line_height = self.font_size * self.config['line_height_multiplier']
         self.num_chars = math.ceil(screen_height / self.line_height) if self.line_height > 0 else 0
         if self.num_chars <= 0: return
 
+        # Width of the strip the column's glyphs are composited in (see SoftwareBackend)
         padding = LEADER_EXTRA_BOLDNESS
-        max_width = self.font_size + (2 * padding)
-        try:
-            self.temp_surface = pygame.Surface((max_width, self.screen_height), pygame.SRCALPHA)
-        except pygame.error:
-            self.temp_surface = None
-            self.num_chars = 0
+        self.strip_width = max(self.font_size + (2 * padding), padding + self.font_cache.max_glyph_width)
 
         self.is_first_run = True
-        self.characters = [[i * self.line_height, random.choice(config['char_list'])] for i in range(self.num_chars)]
+        self._init_arrays()
         self.dormant_counter = 0
         self.leader_flicker_timer = 0.0
         self.trail_length = int(random.randint(*self.config['length_range']))
@@ -381,6 +1056,12 @@ class Column:
 
         self._reset_streak()
 
+    def _init_arrays(self):
+        """Per-char state as contiguous arrays: row y positions and indices into char_list."""
+        num_glyphs = len(self.config['char_list'])
+        self.y_positions = (np.arange(self.num_chars) * self.line_height).astype(np.float32)
+        self.char_indices = np.random.randint(0, num_glyphs, self.num_chars, dtype=glyph_index_dtype(num_glyphs))
+
     def _reset_streak(self):
         if self.is_first_run:
             self.leader_pos_float = float(random.randint(-self.num_chars, -1))
@@ -401,10 +1082,7 @@ class Column:
         self.max_speed_pps = max_speed
         self.speed_change_timer = 0.0
         self.next_speed_change = random.uniform(*SPEED_CHANGE_INTERVAL_RANGE)
-
-        curved_speed_factor = normalized_speed ** FLICKER_SPEED_CURVE_EXPONENT
-        dynamic_interval_ms = (1 - curved_speed_factor) * SLOWEST_LEADER_FLICKER_INTERVAL_MS + curved_speed_factor * FASTEST_LEADER_FLICKER_INTERVAL_MS
-        self.flicker_interval_s = dynamic_interval_ms / 1000.0
+        self._recompute_flicker_interval()
 
         min_len, max_len = self.config['length_range']
         # Canon: bias toward shorter streaks with occasional long dramatic ones
@@ -415,77 +1093,45 @@ class Column:
         self.cascade_pos_float = -1.0
         self._precompute_gradient(normalized_speed)
 
+    def _recompute_flicker_interval(self):
+        """Call whenever speed_pps changes outside ColumnLayer.advance."""
+        self.flicker_interval_s = leader_flicker_interval_s(self.speed_pps, self.min_speed_pps, self.max_speed_pps)
+
     def _precompute_gradient(self, normalized_speed):
         if self.trail_length <= 0:
-            self.gradient_colors = []
+            self.gradient_colors = np.zeros((0, 3), dtype=np.uint8)
             return
 
         leader_color = self.config['leader_color']
-        bright_green = self.config['second_char_color']
-        trail_color = self.config['trail_color']
-        
         brightness_multiplier = 1.0 + (normalized_speed * (LEADER_BRIGHTNESS_SPEED_MULTIPLIER - 1.0))
         dynamic_leader_color = tuple(min(255, int(c * brightness_multiplier)) for c in leader_color)
+        self.gradient_colors = Column._gradient_for(self.config, self.trail_length, dynamic_leader_color)
 
-        self.gradient_colors = []
-        
-        # Canon: ultra-smooth gradient with 5 color stops
-        # Create intermediate colors for smoother transitions
-        mid_bright = (
-            (bright_green[0] + trail_color[0]) // 2,
-            (bright_green[1] + trail_color[1]) // 2,
-            (bright_green[2] + trail_color[2]) // 2
+    @classmethod
+    def _gradient_for(cls, config, trail_length, leader_color):
+        key = (
+            trail_length, leader_color, config['second_char_color'],
+            config['trail_color'], config['quantization_step']
         )
-        dark_green = (
-            trail_color[0] // 2,
-            trail_color[1] // 2,
-            trail_color[2] // 2
-        )
-        
-        # Color stops: position -> color
-        color_stops = [
-            (0.0, dynamic_leader_color),   # Leader: white
-            (0.02, bright_green),           # Char 1-2: immediate bright green
-            (0.15, bright_green),           # Hold bright green
-            (0.30, mid_bright),             # Transition through mid
-            (0.50, trail_color),            # Main trail color
-            (0.75, dark_green),             # Darker green
-            (1.0, (0, 0, 0))                # Fade to black
-        ]
-        
-        for i in range(self.trail_length):
-            position = i / max(1, self.trail_length - 1)
-            
-            if i == 0:
-                # Leader stays pure white
-                color = dynamic_leader_color
-            else:
-                # Find which two stops we're between
-                start_stop = color_stops[0]
-                end_stop = color_stops[-1]
-                
-                for j in range(len(color_stops) - 1):
-                    if color_stops[j][0] <= position <= color_stops[j + 1][0]:
-                        start_stop = color_stops[j]
-                        end_stop = color_stops[j + 1]
-                        break
-                
-                # Interpolate between stops with smoothstep for extra smoothness
-                if end_stop[0] > start_stop[0]:
-                    t = (position - start_stop[0]) / (end_stop[0] - start_stop[0])
-                    # Smoothstep interpolation for silky transitions
-                    t = t * t * (3 - 2 * t)
-                else:
-                    t = 1.0
-                
-                start_color = start_stop[1]
-                end_color = end_stop[1]
-                r = int(start_color[0] + (end_color[0] - start_color[0]) * t)
-                g = int(start_color[1] + (end_color[1] - start_color[1]) * t)
-                b = int(start_color[2] + (end_color[2] - start_color[2]) * t)
-                color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-            
-            self.gradient_colors.append(color)
+        palette = cls._gradient_cache.get(key)
+        if palette is None:
+            palette = build_fade_palette(
+                leader_color, config['second_char_color'], config['trail_color'],
+                trail_length, step=config['quantization_step']
+            )
+            cls._gradient_cache[key] = palette
+        return palette
+
+    @classmethod
+    def prebuild_gradients(cls, config):
+        """
+        Builds the palette for every trail length in config['length_range'] up front,
+        so streak resets never fall through to build_fade_palette. Returns the palettes.
+        Speed-scaled leader colors (LEADER_BRIGHTNESS_SPEED_MULTIPLIER != 1) still build lazily.
+        """
+        min_len, max_len = config['length_range']
+        leader_color = tuple(min(255, int(c)) for c in config['leader_color'])
+        return [cls._gradient_for(config, length, leader_color) for length in range(max(1, min_len), max_len + 1)]
 
     def trigger_cascade(self, y_pos, is_dark):
         if self.cascade_pos_float != -1.0 or self.dormant_counter > 0 or self.trail_length <= (CASCADE_FADE_LENGTH * 2) + 5:
@@ -515,224 +1161,607 @@ class Column:
                 r, g, b = r * scale, g * scale, b * scale
             self.target_cascade_color = (int(r), int(g), int(b))
 
-    def update_and_draw(self, main_surface, delta_time, active_ripples):
-        if self.num_chars <= 0 or not self.temp_surface: return
+    def _cascade_lifecycle_fade(self):
+        """Cascade strength: ramps in at the start and out at the end of the trail, and over CASCADE_FADE_IN_TIME_MS."""
+        lifecycle_fade = 1.0
+        fade_len = CASCADE_FADE_LENGTH
+        if fade_len > 0:
+            dist_from_start = (self.trail_length - 1) - self.cascade_pos_float
+            if dist_from_start < fade_len:
+                lifecycle_fade = dist_from_start / (fade_len - 1) if fade_len > 1 else 1.0
+            elif self.cascade_pos_float < fade_len:
+                lifecycle_fade = self.cascade_pos_float / (fade_len - 1) if fade_len > 1 else 1.0
+        fade_in_duration_s = CASCADE_FADE_IN_TIME_MS / 1000.0
+        if fade_in_duration_s > 0 and self.cascade_age < fade_in_duration_s:
+            lifecycle_fade *= (self.cascade_age / fade_in_duration_s)
+        return lifecycle_fade
+
+    def update_and_draw(self, backend, delta_time, ripples, ripple_luts, ripple_buckets):
+        """Flickers and draws the streak. Motion was already advanced by ColumnLayer.advance."""
+        trail_length = self.trail_length
+        leader_pos_int = int(self.leader_pos_float)
 
-        if self.dormant_counter > 0:
-            self.dormant_counter -= 1
-            return
-        
-        # Variable speed update (canon Matrix effect)
-        if VARIABLE_SPEED_ENABLED:
-            self.speed_change_timer += delta_time
-            if self.speed_change_timer >= self.next_speed_change:
-                # Randomly adjust speed within bounds
-                speed_range = self.max_speed_pps - self.min_speed_pps
-                max_change = speed_range * SPEED_CHANGE_AMOUNT
-                speed_delta = random.uniform(-max_change, max_change)
-                self.speed_pps = max(self.min_speed_pps, min(self.max_speed_pps, self.speed_pps + speed_delta))
-                self.speed_cps = self.speed_pps / self.line_height if self.line_height > 0 else 0
-                
-                # Reset timer and set next change interval
-                self.speed_change_timer = 0.0
-                self.next_speed_change = random.uniform(*SPEED_CHANGE_INTERVAL_RANGE)
+        # Only chars at or behind the leader are drawn (distance 0 .. trail_length - 1)
+        start_char_index = max(0, leader_pos_int - trail_length + 1)
+        end_char_index = min(self.num_chars, leader_pos_int + 1)
+        if start_char_index >= end_char_index: return
+
+        char_list = self.config['char_list']
+        indices = np.arange(start_char_index, end_char_index)
+        distances = leader_pos_int - indices
+        leader_visible = (end_char_index - 1 == leader_pos_int)
+
+        if leader_visible:
+            flicker_interval_s = self.flicker_interval_s
+            leader_flicker_timer = self.leader_flicker_timer
+            if flicker_interval_s < delta_time or leader_flicker_timer >= flicker_interval_s:
+                self.char_indices[leader_pos_int] = random.randrange(len(char_list))
+                if leader_flicker_timer >= flicker_interval_s: self.leader_flicker_timer = 0
+
+        # Canon: distance-based flicker - older/dimmer chars flicker more (up to 3x at the tail)
+        base_flicker = self.config['flicker_chance']
+        flicker_chances = base_flicker + (distances / trail_length) * (base_flicker * 2)
+        rand_floats, rand_glyphs = self.random_pool.pop(len(indices))
+        flicker_mask = (rand_floats < flicker_chances) & (distances > 0)
+        if flicker_mask.any():
+            self.char_indices[indices[flicker_mask]] = rand_glyphs[flicker_mask]
+
+        y_positions = self.y_positions[start_char_index:end_char_index]
+        if self.cascade_pos_float != -1.0:
+            cascade_center = int(self.cascade_pos_float)
+            cascade_fade = self._cascade_lifecycle_fade()
+            cascade_color = self.target_cascade_color
+        else:
+            cascade_center, cascade_fade, cascade_color = -1, 0.0, (0, 0, 0)
 
-        self.leader_flicker_timer += delta_time
-        self.leader_pos_float += self.speed_cps * delta_time
+        ripple_indices = ripple_buckets[self.ripple_bucket] if ripple_buckets else NO_RIPPLE_INDICES
 
-        if self.leader_pos_float - self.trail_length > self.num_chars:
-            self._reset_streak()
-            return
+        colors = compute_colors(
+            leader_pos_int, start_char_index, self.x, y_positions, self.gradient_colors, ripples, ripple_luts,
+            ripple_indices, cascade_center, cascade_fade, cascade_color, self.config['highlight_halo_size'],
+            self.config['quantization_step']
+        )
 
-        leader_pos_int = int(self.leader_pos_float)
-        drawable_chars = []
-
-        start_char_index = max(0, leader_pos_int - self.trail_length + 1)
-        end_char_index = min(self.num_chars, leader_pos_int + 2)
-
-        for i in range(start_char_index, end_char_index):
-            if not (0 <= i < self.num_chars): continue
-            y_pos, value = self.characters[i]
-            distance_from_leader = leader_pos_int - i
-
-            if 0 <= distance_from_leader < self.trail_length:
-                is_leader = (distance_from_leader == 0)
-
-                if is_leader:
-                    # Canon: flicker speed tied to current travel speed (recalculated dynamically)
-                    min_speed, max_speed = self.config['speed_range']
-                    current_normalized_speed = (self.speed_pps - min_speed) / (max_speed - min_speed) if max_speed > min_speed else 0.5
-                    current_normalized_speed = max(0.0, min(1.0, current_normalized_speed))
-                    curved_speed = current_normalized_speed ** FLICKER_SPEED_CURVE_EXPONENT
-                    dynamic_interval_ms = (1 - curved_speed) * SLOWEST_LEADER_FLICKER_INTERVAL_MS + curved_speed * FASTEST_LEADER_FLICKER_INTERVAL_MS
-                    current_flicker_interval = dynamic_interval_ms / 1000.0
-                    
-                    if current_flicker_interval < delta_time or self.leader_flicker_timer >= current_flicker_interval:
-                        self.characters[i][1] = random.choice(self.config['char_list'])
-                        if self.leader_flicker_timer >= self.flicker_interval_s: self.leader_flicker_timer = 0
+        backend.draw_column(self, start_char_index, y_positions.tolist(), colors, leader_visible)
+
+        if self.cascade_pos_float != -1.0:
+            self.cascade_pos_float -= CASCADE_SPEED_CPS * delta_time
+            self.cascade_age += delta_time
+            if self.cascade_pos_float < 0:
+                self.cascade_pos_float = -1.0
+
+
+# --- Column Layer Update ---
+# update_columns(dormant_counter, drawable, leader_pos_float, trail_length, num_chars, line_heights,
+#                speed_pps, speed_cps, min_speed_pps, max_speed_pps, speed_change_timer,
+#                next_speed_change, leader_flicker_timer, flicker_interval_s, delta_time, variable_speed)
+# Advances a ColumnLayer's arrays in place by one frame: counts down dormancy, applies the
+# random speed changes that are due, and moves the awake leaders down. Returns the slots
+# still falling and the slots whose streak has run off the bottom. Compiled by numba into
+# one pass over the columns when available, otherwise a handful of masked NumPy ops.
+
+@njit(cache=True, inline='always')
+def _leader_flicker_interval_one(speed_pps, min_speed_pps, max_speed_pps):
+    """Scalar leader_flicker_interval_s, for the numba kernel."""
+    speed_span = max_speed_pps - min_speed_pps
+    normalized_speed = (speed_pps - min_speed_pps) / speed_span if speed_span > 0 else 0.5
+    curved_speed = max(0.0, min(1.0, normalized_speed)) ** FLICKER_SPEED_CURVE_EXPONENT
+    dynamic_interval_ms = (1 - curved_speed) * SLOWEST_LEADER_FLICKER_INTERVAL_MS + curved_speed * FASTEST_LEADER_FLICKER_INTERVAL_MS
+    return dynamic_interval_ms / 1000.0
+
+@njit(cache=True)
+def _update_columns_kernel(dormant_counter, drawable, leader_pos_float, trail_length, num_chars, line_heights,
+                           speed_pps, speed_cps, min_speed_pps, max_speed_pps, speed_change_timer,
+                           next_speed_change, leader_flicker_timer, flicker_interval_s, delta_time, variable_speed):
+    n = dormant_counter.shape[0]
+    moving = np.empty(n, dtype=np.intp)
+    finished = np.empty(n, dtype=np.intp)
+    num_moving = 0
+    num_finished = 0
+    for i in range(n):
+        if dormant_counter[i] > 0:
+            dormant_counter[i] -= 1
+            continue
+        if not drawable[i]:
+            continue
+
+        if variable_speed:
+            speed_change_timer[i] += delta_time
+            if speed_change_timer[i] >= next_speed_change[i]:
+                min_speed, max_speed = min_speed_pps[i], max_speed_pps[i]
+                max_change = (max_speed - min_speed) * SPEED_CHANGE_AMOUNT
+                speed = max(min_speed, min(max_speed, speed_pps[i] + np.random.uniform(-max_change, max_change)))
+                speed_pps[i] = speed
+                speed_cps[i] = speed / line_heights[i]
+                flicker_interval_s[i] = _leader_flicker_interval_one(speed, min_speed, max_speed)
+                speed_change_timer[i] = 0.0
+                next_speed_change[i] = np.random.uniform(SPEED_CHANGE_INTERVAL_RANGE[0], SPEED_CHANGE_INTERVAL_RANGE[1])
+
+        leader_flicker_timer[i] += delta_time
+        leader_pos_float[i] += speed_cps[i] * delta_time
+        if leader_pos_float[i] - trail_length[i] > num_chars[i]:
+            finished[num_finished] = i
+            num_finished += 1
+        else:
+            moving[num_moving] = i
+            num_moving += 1
+    return moving[:num_moving], finished[:num_finished]
+
+def _update_columns_numpy(dormant_counter, drawable, leader_pos_float, trail_length, num_chars, line_heights,
+                          speed_pps, speed_cps, min_speed_pps, max_speed_pps, speed_change_timer,
+                          next_speed_change, leader_flicker_timer, flicker_interval_s, delta_time, variable_speed):
+    dormant = dormant_counter > 0
+    dormant_counter[dormant] -= 1
+    active = drawable & ~dormant
+
+    # Variable speed update (canon Matrix effect)
+    if variable_speed:
+        speed_change_timer[active] += delta_time
+        changing = np.flatnonzero(active & (speed_change_timer >= next_speed_change))
+        if len(changing):
+            # Randomly adjust speed within bounds
+            min_speeds, max_speeds = min_speed_pps[changing], max_speed_pps[changing]
+            max_change = (max_speeds - min_speeds) * SPEED_CHANGE_AMOUNT
+            speeds = np.clip(speed_pps[changing] + np.random.uniform(-max_change, max_change), min_speeds, max_speeds)
+            speed_pps[changing] = speeds
+            speed_cps[changing] = speeds / line_heights[changing]
+            flicker_interval_s[changing] = leader_flicker_interval_s(speeds, min_speeds, max_speeds)
+
+            # Reset timer and set next change interval
+            speed_change_timer[changing] = 0.0
+            next_speed_change[changing] = np.random.uniform(*SPEED_CHANGE_INTERVAL_RANGE, len(changing))
+
+    leader_flicker_timer[active] += delta_time
+    leader_pos_float[active] += speed_cps[active] * delta_time
+
+    finished = active & (leader_pos_float - trail_length > num_chars)
+    return np.flatnonzero(active & ~finished), np.flatnonzero(finished)
+
+update_columns = _update_columns_kernel if _HAS_NUMBA else _update_columns_numpy
+
+if _HAS_NUMBA:
+    # Same dtypes as ColumnLayer's arrays, so this is the specialization frames use
+    update_columns(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.bool_), np.zeros(1), np.zeros(1, dtype=np.int64),
+                   np.zeros(1, dtype=np.int64), *np.zeros((9, 1)), 0.0, True)
+
+
+class ColumnLayer:
+    """
+    All the columns of one layer. Their motion state (dormancy, leader position, speed and
+    timers) lives here as parallel arrays, so a frame advances every column with a few
+    vector ops and only calls into Python for the columns that have something to draw.
+    Columns read and write their own entry through _LayerArray attributes.
+    """
+    def __init__(self, xs, screen_height, config):
+        num_columns = len(xs)
+        self.dormant_counter = np.zeros(num_columns, dtype=np.int64)
+        self.trail_length = np.zeros(num_columns, dtype=np.int64)
+        (self.leader_pos_float, self.speed_pps, self.speed_cps, self.min_speed_pps, self.max_speed_pps,
+         self.speed_change_timer, self.next_speed_change, self.leader_flicker_timer,
+         self.flicker_interval_s) = np.zeros((9, num_columns), dtype=np.float64)
+
+        self.columns = [Column(x, screen_height, config, self, slot) for slot, x in enumerate(xs)]
+        self.num_chars = np.array([col.num_chars for col in self.columns], dtype=np.int64)
+        self.line_heights = np.array([col.line_height for col in self.columns], dtype=np.float64)
+        self.drawable = self.num_chars > 0
+
+    def __iter__(self):
+        return iter(self.columns)
+
+    def __len__(self):
+        return len(self.columns)
+
+    def advance(self, delta_time):
+        """Moves every awake column along; returns the slots whose streak is still on its way down."""
+        moving, finished = update_columns(
+            self.dormant_counter, self.drawable, self.leader_pos_float, self.trail_length, self.num_chars,
+            self.line_heights, self.speed_pps, self.speed_cps, self.min_speed_pps, self.max_speed_pps,
+            self.speed_change_timer, self.next_speed_change, self.leader_flicker_timer, self.flicker_interval_s,
+            delta_time, VARIABLE_SPEED_ENABLED
+        )
+        for slot in finished.tolist():
+            self.columns[slot]._reset_streak()
+        return moving.tolist()
+
+    def update_and_draw(self, backend, delta_time, ripples, ripple_luts, ripple_buckets):
+        columns = self.columns
+        for slot in self.advance(delta_time):
+            columns[slot].update_and_draw(backend, delta_time, ripples, ripple_luts, ripple_buckets)
+
+
+# --- Frame Backends ---
+# Columns compute their glyph colors, then hand them to a backend to draw.
+# Both backends share the interface: begin_frame, draw_column, end_frame,
+# add_overlay, set_caption and size.
+
+class SoftwareBackend:
+    """
+    Draws into pygame Surfaces: each column composites its glyphs into its own strip,
+    then every strip goes onto one drawing layer. The strips of a ColumnLayer are slots
+    side by side on one sheet, so a frame clears and draws every column's glyphs with a
+    couple of blits() calls per layer instead of a fill() and a blits() per column.
+    The layer is an opaque screen-format surface keyed on black, rather than SRCALPHA:
+    the rain sits on a black background, so glyphs blended over black look the same,
+    and keyed blits move less data than per-pixel alpha ones.
+
+    Only the screen area a column covered last frame or covers this frame is cleared,
+    recomposited and pushed to the display; the rest of the screen is left as it was.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.size = screen.get_size()
+        self.drawing_surface = pygame.Surface(self.size, 0, screen)
+        self.drawing_surface.set_colorkey((0, 0, 0))
+        self.overlays = []
+        self.overlay_sources = []  # (surface, is_strip) to blit each overlay into dirty rects from
+        self.overlay_strip_width = 0
+        self.blit_list = []
+        self.background_color = (0, 0, 0)
+        self.prev_rects = {}  # column -> screen rect it drew into last frame
+        self.rects = {}
+        self.full_redraw = True
+        self.strip_width = 0
+        self.strip_sheets = {}  # layer -> [sheet, transparent strip, clear blits, glyph blits]
+        self.font_caches = set()  # Of the layers drawn, released after each flush
+
+    def _strip_sheet(self, column):
+        sheet = self.strip_sheets.get(column.layer)
+        if sheet is None:
+            strip_size = (column.strip_width, self.size[1])
+            sheet = [
+                pygame.Surface((column.strip_width * len(column.layer), self.size[1]), pygame.SRCALPHA),
+                pygame.Surface(strip_size, pygame.SRCALPHA), [], []
+            ]
+            self.strip_sheets[column.layer] = sheet
+            self.font_caches.add(column.font_cache)
+        return sheet
+
+    def _clear_strips(self, width):
+        """
+        Column-height strips to clear dirty rects with. Narrow, tall rects clear much
+        faster with a blend-flag blit than with fill(), which pays a per-row cost.
+        """
+        if width > self.strip_width:
+            self.strip_width = width
+            self.black_strip = pygame.Surface((width, self.size[1]), 0, self.screen)
+            self.background_strip = pygame.Surface((width, self.size[1]), 0, self.screen)
+            self.background_strip.fill(self.background_color)
+        return self.black_strip, self.background_strip
+
+    def _overlay_sources(self, width):
+        """
+        What to blit each overlay into a dirty rect from. An overlay whose every row is a
+        single color, like the haze and the scanlines, is read from a strip just wide
+        enough for the rects (at x = 0), which stays in cache, instead of from the
+        full-screen surface, which doesn't.
+        """
+        if width > self.overlay_strip_width:
+            self.overlay_strip_width = width
+            sources = []
+            for overlay in self.overlays:
+                color = pygame.surfarray.array3d(overlay)
+                alpha = pygame.surfarray.array_alpha(overlay)
+                if (color == color[:1]).all() and (alpha == alpha[:1]).all():
+                    sources.append((overlay.subsurface((0, 0, width, overlay.get_height())).copy(), True))
                 else:
-                    # Canon: distance-based flicker - older/dimmer chars flicker more
-                    base_flicker = self.config['flicker_chance']
-                    distance_factor = distance_from_leader / self.trail_length  # 0 near leader, 1 at end
-                    flicker_chance = base_flicker + (distance_factor * base_flicker * 2)  # Up to 3x more at tail
-                    if random.random() < flicker_chance:
-                        self.characters[i][1] = random.choice(self.config['char_list'])
-
-                value = self.characters[i][1]
-                final_color = self.gradient_colors[distance_from_leader]
-
-                if self.cascade_pos_float != -1.0:
-                    dist_from_hl_center = abs(distance_from_leader - int(self.cascade_pos_float))
-                    halo_size = self.config['highlight_halo_size']
-                    if dist_from_hl_center <= halo_size:
-                        halo_falloff = (halo_size - dist_from_hl_center) / halo_size if halo_size > 0 else 1.0
-                        lifecycle_fade = 1.0
-                        fade_len = CASCADE_FADE_LENGTH
-                        if fade_len > 0:
-                            dist_from_start = (self.trail_length - 1) - self.cascade_pos_float
-                            if dist_from_start < fade_len:
-                                lifecycle_fade = dist_from_start / (fade_len - 1) if fade_len > 1 else 1.0
-                            elif self.cascade_pos_float < fade_len:
-                                lifecycle_fade = self.cascade_pos_float / (fade_len - 1) if fade_len > 1 else 1.0
-                        final_intensity = halo_falloff * lifecycle_fade
-                        fade_in_duration_s = CASCADE_FADE_IN_TIME_MS / 1000.0
-                        if fade_in_duration_s > 0 and self.cascade_age < fade_in_duration_s:
-                            final_intensity *= (self.cascade_age / fade_in_duration_s)
-                        final_intensity = max(0.0, min(1.0, final_intensity))
-                        r,g,b = final_color
-                        tr,tg,tb = self.target_cascade_color
-                        final_color = (int(r + (tr - r) * final_intensity), int(g + (tg - g) * final_intensity), int(b + (tb - b) * final_intensity))
-
-                for ripple in active_ripples:
-                    max_possible_radius = ripple.current_radius + RIPPLE_DISTORTION_AMPLITUDE
-                    if abs(self.x - ripple.origin_x) > max_possible_radius or \
-                       abs(y_pos - ripple.origin_y) > max_possible_radius:
-                        continue
-                    
-                    dx = self.x - ripple.origin_x
-                    dy = y_pos - ripple.origin_y
-                    dist_sq = dx * dx + dy * dy
-                    
-                    angle = math.atan2(dy, dx)
-                    distortion = math.sin(angle * RIPPLE_DISTORTION_FREQUENCY + ripple.distortion_phase) * RIPPLE_DISTORTION_AMPLITUDE
-                    distorted_radius = ripple.current_radius + distortion
-                    
-                    if dist_sq < distorted_radius * distorted_radius:
-                        dist = math.sqrt(dist_sq)
-                        proximity_fade = 1.0 - (dist / distorted_radius) if distorted_radius > 0 else 0
-                        
-                        fade_in_duration_s = RIPPLE_FADE_IN_TIME_MS / 1000.0
-                        lifecycle_fade = 0.0
-                        if ripple.age < fade_in_duration_s:
-                            progress = ripple.age / fade_in_duration_s
-                            p = max(0.0, min(1.0, progress))
-                            lifecycle_fade = p * p * p
-                        else:
-                            progress = (ripple.age - fade_in_duration_s) / RIPPLE_FADE_OUT_TIME_S
-                            p = 1.0 - max(0.0, min(1.0, progress))
-                            lifecycle_fade = p * p * p
-                        
-                        final_intensity = proximity_fade * lifecycle_fade
-                        final_intensity = max(0.0, min(1.0, final_intensity))
-
-                        r,g,b = final_color
-                        tr,tg,tb = ripple.target_color
-                        final_color = (
-                            int(r + (tr - r) * final_intensity),
-                            int(g + (tg - g) * final_intensity),
-                            int(b + (tb - b) * final_intensity)
-                        )
-                
-                # --- OPTIMIZATION: COLOR QUANTIZATION ---
-                final_color = quantize_color(final_color, step=COLOR_QUANTIZATION_STEP)
+                    sources.append((overlay, False))
+            self.overlay_sources = sources
+        return self.overlay_sources
+
+    def add_overlay(self, surface):
+        # Kept straight (not premultiplied) alpha: SDL's own SIMD alpha blit is about
+        # twice as fast here as pygame's BLEND_PREMULTIPLIED blitter
+        self.overlays.append(surface)
+        self.overlay_strip_width = 0
+        self.full_redraw = True
+
+    def set_caption(self, caption):
+        pygame.display.set_caption(caption)
+
+    def begin_frame(self, background_color):
+        if background_color != self.background_color:
+            self.background_color = background_color
+            self.strip_width = 0
+            self.full_redraw = True
+        if not self.prev_rects:
+            return
+        black_strip, _ = self._clear_strips(max(rect.width for rect in self.prev_rects.values()))
+        self.drawing_surface.blits(
+            [(black_strip, rect, (0, 0, rect.width, rect.height), pygame.BLEND_RGB_MIN) for rect in self.prev_rects.values()],
+            doreturn=False
+        )
 
-                char_surface = self.font_cache.get_surface(value, final_color)
-                drawable_chars.append((char_surface, y_pos, is_leader))
-        
-        if not drawable_chars: return
+    def draw_column(self, column, start, y_list, colors, leader_visible):
+        font_cache = column.font_cache
+        end = start + len(y_list)
+        surfaces = font_cache.surfaces_for(column.char_indices[start:end], colors)
+        if leader_visible:
+            surfaces[-1] = font_cache.surfaces_for(column.char_indices[end - 1:end], colors[-1:], FontCache.LEADER)[0]
 
-        min_y = drawable_chars[0][1]
-        max_y = drawable_chars[-1][1]
-        last_char_surf, _, _ = drawable_chars[-1]
-        rect_height = (max_y - min_y) + last_char_surf.get_height()
-        rect_width = self.temp_surface.get_width()
-        dirty_area_on_temp_surf = pygame.Rect(0, min_y, rect_width, rect_height)
+        sheet, transparent_strip, clear_blits, glyph_blits = self._strip_sheet(column)
+        min_y = y_list[0]
+        max_y = y_list[-1]
+        rect_height = (max_y - min_y) + surfaces[-1].get_height()
+        rect_width = column.strip_width
+        sheet_x = column.slot * rect_width
+        dirty_area_on_sheet = pygame.Rect(sheet_x, min_y, rect_width, rect_height)
 
-        self.temp_surface.fill((0, 0, 0, 0), dirty_area_on_temp_surf)
+        clear_blits.append((transparent_strip, dirty_area_on_sheet, (0, 0, rect_width, dirty_area_on_sheet.height), pygame.BLEND_RGBA_MIN))
 
         padding = LEADER_EXTRA_BOLDNESS
-        origin_x = padding
+        origin_x = sheet_x + padding
         blend_mode = pygame.BLEND_RGBA_MAX
 
-        for char_surf, y_pos, is_leader in drawable_chars:
-            if is_leader:
-                bold_offset = 1 if self.config['is_bold'] else 0
-                self.temp_surface.blit(char_surf, (origin_x, y_pos), special_flags=blend_mode)
-                if self.config['is_bold']:
-                    self.temp_surface.blit(char_surf, (origin_x + 1, y_pos), special_flags=blend_mode)
-                for i in range(LEADER_EXTRA_BOLDNESS):
-                    offset = (i // 2) + 1
-                    if i % 2 == 0:
-                        self.temp_surface.blit(char_surf, (origin_x + bold_offset + offset, y_pos), special_flags=blend_mode)
-                    else:
-                        self.temp_surface.blit(char_surf, (origin_x - offset, y_pos), special_flags=blend_mode)
-            else:
-                self.temp_surface.blit(char_surf, (origin_x, y_pos), special_flags=blend_mode)
-                if self.config['is_bold']:
-                    self.temp_surface.blit(char_surf, (origin_x + 1, y_pos), special_flags=blend_mode)
+        # One blit per glyph: bold passes are baked into the FontCache masters
+        glyph_blits.extend([(char_surf, (origin_x, y_pos), None, blend_mode) for char_surf, y_pos in zip(surfaces, y_list)])
+        if leader_visible:
+            glyph_blits[-1] = (surfaces[-1], (origin_x + font_cache.leader_offset_x, y_list[-1]), None, blend_mode)
+
+        blit_x = column.x - padding
+        self.blit_list.append((sheet, (blit_x, min_y), dirty_area_on_sheet))
+        self.rects[column] = pygame.Rect(blit_x, min_y, rect_width, rect_height)
+
+    def end_frame(self):
+        for sheet, _, clear_blits, glyph_blits in self.strip_sheets.values():
+            if glyph_blits:
+                sheet.blits(clear_blits, doreturn=False)
+                sheet.blits(glyph_blits, doreturn=False)
+                clear_blits.clear()
+                glyph_blits.clear()
+        for font_cache in self.font_caches:
+            font_cache.release_evicted()
+        if self.blit_list:
+            self.drawing_surface.blits(self.blit_list, doreturn=False)
+            self.blit_list = []
+
+        screen = self.screen
+        drawing_surface = self.drawing_surface
+        overlays = self.overlays
+        prev_rects, rects = self.prev_rects, self.rects
+        self.prev_rects, self.rects = rects, {}
+
+        if self.full_redraw:
+            self.full_redraw = False
+            screen.fill(self.background_color)
+            screen.blit(drawing_surface, (0, 0))
+            for overlay in overlays:
+                screen.blit(overlay, (0, 0))
+            pygame.display.flip()
+            return
 
-        blit_x = self.x - padding
-        main_surface.blit(self.temp_surface, (blit_x, min_y), area=dirty_area_on_temp_surf)
+        # One rect per column: last frame's glyphs (to erase) and this frame's
+        dirty = [rect.union(prev_rects[column]) if column in prev_rects else rect for column, rect in rects.items()]
+        dirty.extend(rect for column, rect in prev_rects.items() if column not in rects)
+        if not dirty:
+            return
+        # Clip to the screen: an area blit with an off-screen origin would shift the copy
+        screen_rect = screen.get_rect()
+        dirty = [rect.clip(screen_rect) for rect in dirty]
+
+        # MIN then MAX against a background-colored strip resets a rect to the background
+        max_width = max(rect.width for rect in dirty)
+        _, background_strip = self._clear_strips(max_width)
+        overlay_sources = self._overlay_sources(max_width) if overlays else ()
+        blit_list = []
+        for rect in dirty:
+            strip_area = (0, 0, rect.width, rect.height)
+            blit_list.append((background_strip, rect, strip_area, pygame.BLEND_RGB_MIN))
+            blit_list.append((background_strip, rect, strip_area, pygame.BLEND_RGB_MAX))
+            blit_list.append((drawing_surface, rect, rect))
+            blit_list.extend(
+                (source, rect, (0, rect.y, rect.width, rect.height) if is_strip else rect)
+                for source, is_strip in overlay_sources
+            )
+        screen.blits(blit_list, doreturn=False)
+        pygame.display.update(dirty)
 
-        if self.cascade_pos_float != -1.0:
-            self.cascade_pos_float -= CASCADE_SPEED_CPS * delta_time
-            self.cascade_age += delta_time
-            if self.cascade_pos_float < 0:
-                self.cascade_pos_float = -1.0
+
+class GPUBackend:
+    """
+    Draws through an SDL2 Renderer from one white glyph atlas texture per font cache,
+    tinted at draw time with its color mod, so there are no per-color surfaces and no
+    per-column strips. Every glyph comes from the same texture, so SDL can batch the draws.
+    """
+    BLENDMODE_BLEND = 1  # SDL_BLENDMODE_BLEND
+
+    def __init__(self, window, renderer):
+        self.window = window
+        self.renderer = renderer
+        self.size = tuple(window.size)
+        self.overlays = []
+        self.glyph_atlases = {}
+        self.origin_x = 0  # Canvas x shown at the window's left edge (see MultiWindowBackend)
+
+    def _texture(self, surface):
+        texture = Texture.from_surface(self.renderer, surface)
+        texture.blend_mode = self.BLENDMODE_BLEND
+        return texture
+
+    def _atlas_for(self, font_cache):
+        """
+        (texture, (body rects, leader rects)) for a font cache. The atlas has one row per
+        variant with each unique glyph master once; the rect lists are indexed like char_list.
+        """
+        atlas = self.glyph_atlases.get(id(font_cache))
+        if atlas is None:
+            variant_masters = font_cache.variant_masters
+            chars = font_cache.unique_chars
+            cell_width = max(surface.get_width() for masters in variant_masters for surface in masters.values())
+            cell_height = max(surface.get_height() for masters in variant_masters for surface in masters.values())
+            atlas_surface = pygame.Surface((cell_width * len(chars), cell_height * len(variant_masters)), pygame.SRCALPHA)
+            variant_rects = []
+            for row, masters in enumerate(variant_masters):
+                by_char = {}
+                for col, char in enumerate(chars):
+                    surface = masters[char]
+                    by_char[char] = pygame.Rect(col * cell_width, row * cell_height, *surface.get_size())
+                    atlas_surface.blit(surface, by_char[char])
+                variant_rects.append([by_char[char] for char in font_cache.char_list])
+            atlas = (self._texture(atlas_surface), tuple(variant_rects))
+            self.glyph_atlases[id(font_cache)] = atlas
+        return atlas
+
+    def add_overlay(self, surface):
+        self.overlays.append(self._texture(surface))
+
+    def set_caption(self, caption):
+        self.window.title = caption
+
+    def begin_frame(self, background_color):
+        self.renderer.draw_color = (*background_color, 255)
+        self.renderer.clear()
+
+    def draw_column(self, column, start, y_list, colors, leader_visible):
+        atlas, (body_rects, leader_rects) = self._atlas_for(column.font_cache)
+        x = int(column.x) - self.origin_x
+        char_indices = column.char_indices[start:start + len(y_list)].tolist()
+        color_list = colors.tolist()
+        num_body = len(y_list) - 1 if leader_visible else len(y_list)
+        for i in range(num_body):
+            src = body_rects[char_indices[i]]
+            atlas.color = color_list[i]
+            atlas.draw(srcrect=src, dstrect=(x, int(y_list[i]), src.width, src.height))
+        if leader_visible:
+            src = leader_rects[char_indices[-1]]
+            atlas.color = color_list[-1]
+            atlas.draw(srcrect=src, dstrect=(x + column.font_cache.leader_offset_x, int(y_list[-1]), src.width, src.height))
+
+    def end_frame(self):
+        for overlay in self.overlays:
+            overlay.draw()
+        self.renderer.present()
+
+
+class MultiWindowBackend:
+    """
+    One process driving a borderless window per display. Each window is a GPUBackend
+    showing its slice of one wide canvas (displays laid out left to right), so every
+    column, ripple and cascade is shared; only the glyph atlases are per window renderer.
+    """
+    def __init__(self, views):
+        self.views = views
+        self.size = (sum(view.size[0] for view in views), max(view.size[1] for view in views))
+
+    def add_overlay(self, surface):
+        for view in self.views:
+            width, height = view.size
+            view.add_overlay(surface.subsurface((view.origin_x, 0, width, height)))
+
+    def set_caption(self, caption):
+        for view in self.views:
+            view.set_caption(caption)
+
+    def begin_frame(self, background_color):
+        for view in self.views:
+            view.begin_frame(background_color)
+
+    def draw_column(self, column, start, y_list, colors, leader_visible):
+        x = column.x
+        for view in self.views:
+            if view.origin_x - column.strip_width < x < view.origin_x + view.size[0]:
+                view.draw_column(column, start, y_list, colors, leader_visible)
+
+    def end_frame(self):
+        for view in self.views:
+            view.end_frame()
+
+
+SDL_WINDOWPOS_CENTERED_DISPLAY = 0x2FFF0000  # | display index, like SDL's SDL_WINDOWPOS_CENTERED_DISPLAY(i)
+
+def open_multi_window_display(display_indices=None):
+    """
+    Opens a borderless, display-sized window on each of display_indices (default: every
+    display) and returns the MultiWindowBackend that draws into them.
+    """
+    desktop_sizes = pygame.display.get_desktop_sizes()
+    if display_indices is None:
+        display_indices = range(len(desktop_sizes))
+    valid_indices = [index for index in display_indices if 0 <= index < len(desktop_sizes)]
+    if len(valid_indices) < len(display_indices):
+        print(f"Warning: only {len(desktop_sizes)} display(s) found, skipping the others")
+    views = []
+    origin_x = 0
+    for index in valid_indices or [0]:
+        size = desktop_sizes[index]
+        window = Window(
+            f"Matrix Rain {index}", size=size, position=SDL_WINDOWPOS_CENTERED_DISPLAY | index, borderless=True
+        )
+        # No vsync: presenting several vsynced windows in turn would wait a vblank for each
+        view = GPUBackend(window, Renderer(window, vsync=False))
+        view.origin_x = origin_x
+        origin_x += size[0]
+        views.append(view)
+    return MultiWindowBackend(views)
+
+
+def open_display(size, flags, vsync=0, position=None, use_gpu=False):
+    """
+    Opens the window and returns the backend that draws into it. use_gpu asks for an
+    SDL2 Renderer window, falling back to a display-module surface if that fails.
+    """
+    if use_gpu and not _HAS_SDL2_RENDERER:
+        print("Note: this pygame has no SDL2 renderer, using software rendering")
+    elif use_gpu:
+        try:
+            window = Window(
+                "Matrix Rain", size=size, position=position if position is not None else WINDOWPOS_UNDEFINED,
+                borderless=bool(flags & pygame.NOFRAME), resizable=bool(flags & pygame.RESIZABLE)
+            )
+            return GPUBackend(window, Renderer(window, vsync=bool(vsync)))
+        except Exception as e:
+            print(f"Could not create GPU renderer, using software rendering. Details: {e}")
+    return SoftwareBackend(pygame.display.set_mode(size, flags, vsync=vsync))
 
 
-def draw_crt_grid(surface, grid_size, color):
+def draw_crt_grid(surface, spacing, alpha):
     """Draw authentic CRT scanlines (horizontal only) with variable intensity."""
     surface.fill((0, 0, 0, 0))
     width, height = surface.get_size()
-    
-    # Authentic CRT: horizontal scanlines only, alternating intensity
-    for y in range(0, height, CRT_SCANLINE_SPACING):
-        # Alternate between darker and lighter scanlines for realism
-        alpha = CRT_SCANLINE_ALPHA if (y // CRT_SCANLINE_SPACING) % 2 == 0 else CRT_SCANLINE_ALPHA // 2
-        pygame.draw.line(surface, (0, 0, 0, alpha), (0, y), (width, y))
+    if spacing <= 0:
+        return
 
-def main():
-    global HAZE_ENABLED, CRT_GRID_ENABLED, COLOR_QUANTIZATION_STEP, FRAME_RATE
+    # Authentic CRT: horizontal scanlines only, alternating between darker and
+    # lighter. The pattern repeats every two scanlines, so draw one period and tile it.
+    period = spacing * 2
+    strip = pygame.Surface((width, period), pygame.SRCALPHA)
+    strip.fill((0, 0, 0, alpha), (0, 0, width, 1))
+    strip.fill((0, 0, 0, alpha // 2), (0, spacing, width, 1))
+    surface.blits([(strip, (0, y)) for y in range(0, height, period)], doreturn=False)
 
+def flatten_overlays(surfaces, size=None):
+    """
+    Composites static SRCALPHA overlays (bottom first) into one, so each frame blends a
+    single layer over the rain. Uses the exact "over" operator, so the result matches
+    blitting the overlays one after another (up to rounding).
+    If size is given, the overlays are one band of a pattern that repeats down the
+    screen, and the result is that band tiled to fill size.
+    """
+    flattened = surfaces[0].copy() if size is None else pygame.Surface(size, pygame.SRCALPHA)
+    color = pygame.surfarray.array3d(surfaces[0]).astype(np.float32)
+    alpha = pygame.surfarray.array_alpha(surfaces[0]).astype(np.float32) / 255.0
+    for surface in surfaces[1:]:
+        src_alpha = pygame.surfarray.array_alpha(surface).astype(np.float32) / 255.0
+        under = alpha * (1.0 - src_alpha)
+        out_alpha = src_alpha + under
+        premultiplied = pygame.surfarray.array3d(surface) * src_alpha[..., None] + color * under[..., None]
+        color = np.divide(premultiplied, out_alpha[..., None], out=np.zeros_like(premultiplied), where=out_alpha[..., None] > 0)
+        alpha = out_alpha
+    color = np.rint(color).astype(np.uint8)
+    alpha = np.rint(alpha * 255.0).astype(np.uint8)
+    if size is not None:
+        # surfarray arrays are indexed [x, y]
+        reps = -(-size[1] // alpha.shape[1])
+        color = np.tile(color, (1, reps, 1))[:, :size[1]]
+        alpha = np.tile(alpha, (1, reps))[:, :size[1]]
+    pygame.surfarray.blit_array(flattened, color)
+    flattened_alpha = pygame.surfarray.pixels_alpha(flattened)
+    flattened_alpha[...] = alpha
+    del flattened_alpha  # Unlock the surface
+    return flattened
+
+def main():
     # --- READ CONFIGURATION ---
-    config = configparser.ConfigParser()
-    try:
-        config.read(resource_path('config.ini'))
-        ripples_enabled_startup = config.getboolean('Settings', 'EnableRipples')
-        cascades_enabled_startup = config.getboolean('Settings', 'EnableCascades')
-        HAZE_ENABLED = config.getboolean('Settings', 'EnableHaze')
-        CRT_GRID_ENABLED = config.getboolean('Settings', 'EnableCrtGrid')
-        
-        fg_spacing = config.getint('Settings', 'ForegroundSpacing')
-        
-        COLOR_QUANTIZATION_STEP = config.getint('Settings', 'ColorQuantizationStep')
-        FRAME_RATE = config.getint('Settings', 'TargetFPS')
-        ADAPTIVE_THRESHOLD = config.getint('Settings', 'AdaptiveThreshold')
-        
-    except Exception as e:
-        print(f"Could not read config.ini, using default settings. Error: {e}")
-        ripples_enabled_startup = True
-        cascades_enabled_startup = True
-        fg_spacing = FG_STREAM_SPACING
-        ADAPTIVE_THRESHOLD = 45
-        wallpaper_mode = False
-
-    # Read wallpaper mode with its own try block (optional setting)
-    try:
-        wallpaper_mode = config.getboolean('Settings', 'WallpaperMode')
-    except:
-        wallpaper_mode = False
+    cfg = RainConfig.from_ini(resource_path('config.ini'))
 
     # --- ARGUMENT PARSING (do this early for display setup) ---
     is_screensaver_mode = '--screensaver' in sys.argv
@@ -748,15 +1777,41 @@ def main():
             print("Warning: --display requires a display index number")
             target_display = None
 
+    # --ready-fd: a socket from the multi-display launchers, told once this window is in place
+    ready_fd = None
+    if '--ready-fd' in sys.argv:
+        try:
+            ready_fd = int(sys.argv[sys.argv.index('--ready-fd') + 1])
+        except (IndexError, ValueError):
+            print("Warning: --ready-fd requires a file descriptor number")
+
+    # Parse --displays (e.g. "0,1" or "all"): one process with a window on each display
+    is_multi_window_mode = '--displays' in sys.argv
+    target_displays = None
+    if is_multi_window_mode:
+        try:
+            displays_arg = sys.argv[sys.argv.index('--displays') + 1]
+            target_displays = None if displays_arg == 'all' else [int(i) for i in displays_arg.split(',')]
+        except (IndexError, ValueError):
+            print("Warning: --displays requires 'all' or comma-separated display indices, using all displays")
+        if not _HAS_SDL2_RENDERER:
+            print("Note: --displays needs pygame's SDL2 renderer, spanning all displays instead")
+            is_multi_window_mode = False
+
     # Determine if we're in a per-display mode (screensaver OR wallpaper with --display)
     is_per_display_mode = (is_screensaver_mode or is_wallpaper_arg) and target_display is not None
+    if is_per_display_mode and not _HAS_APPKIT:
+        print("Note: --display requires pyobjc (pip install pyobjc), spanning all displays instead")
+        is_per_display_mode = False
 
     # --- DISPLAY INITIALIZATION ---
-    if is_per_display_mode:
+    if is_multi_window_mode:
+        pygame.init()
+        backend = open_multi_window_display(target_displays)
+        total_width, total_height = backend.size
+        print(f"One window per display, {len(backend.views)} display(s): canvas {total_width}x{total_height}")
+    elif is_per_display_mode:
         # Use PyObjC to get the exact display dimensions and position
-        from AppKit import NSScreen
-        from Foundation import NSMakeRect
-        
         screens = NSScreen.screens()
         if target_display >= len(screens):
             print(f"Warning: Display {target_display} not found, using display 0")
@@ -776,14 +1831,16 @@ def main():
         
         # Initialize pygame and create a NOFRAME window (not FULLSCREEN to avoid minimize conflicts)
         pygame.init()
-        screen = pygame.display.set_mode((total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF)
+        backend = open_display(
+            (total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF,
+            position=(screen_x, screen_y), use_gpu=cfg.gpu_renderer
+        )
         
         # Wait for window to be ready, then position it on the target display
         pygame.event.pump()
         pygame.time.wait(100)
         
         # Use PyObjC to move the window to the correct display
-        from AppKit import NSApplication
         app = NSApplication.sharedApplication()
         for window in app.windows():
             new_frame = NSMakeRect(screen_x, screen_y, total_width, total_height)
@@ -798,7 +1855,10 @@ def main():
             print(f"Using PyObjC NSScreen: origin=({min_x}, {min_y}), size=({total_width}x{total_height})")
             os.environ['SDL_VIDEO_WINDOW_POS'] = f"{min_x},{min_y}"
             pygame.init()
-            screen = pygame.display.set_mode((total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF, vsync=1)
+            backend = open_display(
+                (total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF, vsync=1,
+                position=(min_x, min_y), use_gpu=cfg.gpu_renderer
+            )
             # Also reposition with PyObjC after creation to ensure correct placement
             pygame.time.wait(50)
             reposition_window_to_all_displays()
@@ -811,33 +1871,37 @@ def main():
                 print(f"Using screeninfo: origin=({min_x}, {min_y}), size=({total_width}x{total_height})")
                 os.environ['SDL_VIDEO_WINDOW_POS'] = f"{min_x},{min_y}"
                 pygame.init()
-                screen = pygame.display.set_mode((total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF, vsync=1)
+                backend = open_display(
+                    (total_width, total_height), pygame.NOFRAME | pygame.DOUBLEBUF, vsync=1,
+                    position=(min_x, min_y), use_gpu=cfg.gpu_renderer
+                )
             except (screeninfo.common.ScreenInfoError, pygame.error):
                 pygame.init()
                 total_width, total_height = 1280, 720
-                screen = pygame.display.set_mode((total_width, total_height), pygame.RESIZABLE | pygame.DOUBLEBUF, vsync=1)
+                backend = open_display(
+                    (total_width, total_height), pygame.RESIZABLE | pygame.DOUBLEBUF, vsync=1, use_gpu=cfg.gpu_renderer
+                )
 
     # --- Re-check screensaver mode (already parsed above) ---
 
     # --- WALLPAPER / SCREENSAVER ACTIVATION ---
     if is_screensaver_mode:
         # Screensaver settings: High quality, top level, exit on input
-        ripples_enabled_startup = True
-        cascades_enabled_startup = True
-        FRAME_RATE = 60
-        WallpaperMode = False # Ignore config wallpaper mode
+        # (config wallpaper mode is ignored)
+        cfg = replace(cfg, ripples_enabled=True, cascades_enabled=True, frame_rate=60, wallpaper_mode=False)
         pygame.mouse.set_visible(False)
-    elif is_wallpaper_arg or wallpaper_mode:
+    elif is_wallpaper_arg or cfg.wallpaper_mode:
         # Wallpaper mode: runs behind all windows at desktop level
-        pygame.display.set_caption("Matrix Rain Wallpaper")
+        capped_rate = min(cfg.frame_rate, WALLPAPER_MAX_FRAME_RATE)
+        # Scale the adaptive-quality threshold with the cap, or the capped rate itself
+        # would read as "performance low" and switch the effects off
+        cfg = replace(cfg, frame_rate=capped_rate, adaptive_threshold=cfg.adaptive_threshold * capped_rate // cfg.frame_rate)
+        backend.set_caption("Matrix Rain Wallpaper")
         pygame.time.wait(100)
         # For per-display wallpaper mode, we need to apply desktop window level
         if is_per_display_mode:
             # Apply desktop level for this specific window
             try:
-                from AppKit import NSApplication
-                from Cocoa import NSWindowCollectionBehaviorCanJoinAllSpaces, NSWindowCollectionBehaviorStationary
-                
                 app = NSApplication.sharedApplication()
                 for window in app.windows():
                     # kCGDesktopWindowLevel = -2147483623 (desktop level)
@@ -853,24 +1917,19 @@ def main():
         else:
             set_wallpaper_mode()
     
-    drawing_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-    haze_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-    grid_surface = pygame.Surface((total_width, total_height), pygame.SRCALPHA)
-
     clock = pygame.time.Clock()
     
     # If screensaver, ensure window is above everything
-    if is_screensaver_mode:
+    if is_screensaver_mode and _HAS_APPKIT:
         try:
-            from AppKit import NSApplication, NSWindow
-            from Cocoa import NSWindowCollectionBehaviorCanJoinAllSpaces, NSWindowCollectionBehaviorStationary
-            
             app = NSApplication.sharedApplication()
+            # Fetched once: each app.windows() is a round trip over the PyObjC bridge
+            windows = list(app.windows())
             
             # Set window level and behaviors
             # kCGScreenSaverWindowLevel = 1000 or 1002 depending on OS version
             # Using a high floating level to cover dock and menus
-            for window in app.windows():
+            for window in windows:
                 window.setLevel_(2000) 
                 window.setHidesOnDeactivate_(False)
                 # Make it appear on all spaces/desktops
@@ -880,22 +1939,22 @@ def main():
                 )
             
             # Only reposition if NOT using --display (trying to span all monitors)
-            # When using --display, we're in fullscreen mode on a specific display
-            if target_display is None:
+            # When using --display, we're in fullscreen mode on a specific display;
+            # with --displays, each window already covers its own display
+            if target_display is None and not is_multi_window_mode:
                 # Small delay to let the window level change take effect
                 pygame.time.wait(50)
                 
                 # Now reposition to cover all displays AFTER window level is set
                 # This is critical - macOS may reset window frame when level changes
                 reposition_window_to_all_displays()
-            else:
+            elif target_display is not None:
                 # Re-apply frame for specific display manually in case Level change reset it
                 try:
-                    from Foundation import NSMakeRect
                     # Make sure we use the coordinates calculated earlier
                     pygame.time.wait(50)
                     new_frame = NSMakeRect(screen_x, screen_y, total_width, total_height)
-                    for window in app.windows():
+                    for window in windows:
                         window.setFrame_display_animate_(new_frame, True, False)
                     print(f"Re-applied frame for display {target_display}: {screen_x},{screen_y} {total_width}x{total_height}")
                 except Exception as e:
@@ -904,7 +1963,7 @@ def main():
 
             
             # Bring window to front WITHOUT affecting other windows
-            for window in app.windows():
+            for window in windows:
                 # Use orderFrontRegardless instead of makeKeyAndOrderFront
                 # This brings the window to front without minimizing other windows
                 window.orderFrontRegardless()
@@ -912,7 +1971,7 @@ def main():
             # Only activate app for the primary display (0) or when not using --display
             # This prevents display 0 from minimizing display 1's window
             if target_display is None or target_display == 0:
-                NSApplication.sharedApplication().activateIgnoringOtherApps_(True)
+                app.activateIgnoringOtherApps_(True)
         except Exception as e:
             print(f"Could not set screensaver window level: {e}")
 
@@ -920,12 +1979,18 @@ def main():
     if is_screensaver_mode:
          pygame.event.clear()
 
+    # The window is placed and leveled; the launcher can start the next display's
+    if ready_fd is not None:
+        signal_launcher_ready(ready_fd)
+
 
     try:
         font_path = resource_path("fonts/matrix.ttf")
         fonts = {s: pygame.font.Font(font_path, s) for s in [FG_FONT_SIZE]}
         caches = {
-            'FG': FontCache(fonts[FG_FONT_SIZE], FG_CHAR_LIST, FONT_STRETCH_FACTOR)
+            'FG': FontCache(
+                fonts[FG_FONT_SIZE], FG_CHAR_LIST, cfg.font_stretch_factor, cfg.color_quantization_step, FG_IS_BOLD
+            )
         }
     except Exception as e:
         print(f"Error loading font. Make sure 'matrix.ttf' is present in the 'fonts' folder. Details: {e}")
@@ -942,28 +2007,77 @@ def main():
     ]
     configs[prefix.lower()] = {k: globals()[f'{prefix}_{k.upper()}'] for k in config_keys}
     configs[prefix.lower()]['font_cache'] = caches[prefix]
+    configs[prefix.lower()]['random_pool'] = RandomPool(len(FG_CHAR_LIST))
+    configs[prefix.lower()]['quantization_step'] = cfg.color_quantization_step
+
+    # Build every trail palette now, then warm the glyph cache with every color they contain.
+    palette_colors = set()
+    palettes = Column.prebuild_gradients(configs[prefix.lower()])
+    for palette in palettes:
+        palette_colors.update(tuple(c) for c in palette.tolist())
+    caches[prefix].prewarm(palette_colors)
+    caches[prefix].prewarm({tuple(palette[0].tolist()) for palette in palettes}, FontCache.LEADER)
 
     column_layers = [
-        [Column(x, total_height, configs['fg']) for x in range(0, total_width, fg_spacing)]
+        ColumnLayer(range(0, total_width, cfg.fg_spacing), total_height, configs['fg'])
     ]
     
     cascade_manager = HighlightCascadeManager(column_layers)
     ripple_manager = RippleManager(total_width, total_height)
 
-    if CRT_GRID_ENABLED:
-        draw_crt_grid(grid_surface, CRT_SCANLINE_SPACING, CRT_SCANLINE_ALPHA)
-    if HAZE_ENABLED:
+    # Hot-loop settings as locals (LOAD_FAST instead of a global/attribute lookup per frame)
+    frame_rate = cfg.frame_rate
+    background_color = cfg.background_color
+    haze_enabled = cfg.haze_enabled
+    crt_grid_enabled = cfg.crt_grid_enabled
+    adaptive_threshold = cfg.adaptive_threshold
+
+    # Static overlays, flattened once into a single layer composited over the rain.
+    # They only change down the screen with the scanline period, so just one band of
+    # that height is drawn and flattened, then tiled to the full screen.
+    band_height = CRT_SCANLINE_SPACING * 2 if crt_grid_enabled and CRT_SCANLINE_SPACING > 0 else 1
+    overlays = []
+    if haze_enabled:
+        haze_surface = pygame.Surface((total_width, band_height), pygame.SRCALPHA)
         haze_surface.fill((*HAZE_COLOR, HAZE_ALPHA))
+        overlays.append(haze_surface)
+    if crt_grid_enabled:
+        grid_surface = pygame.Surface((total_width, band_height), pygame.SRCALPHA)
+        draw_crt_grid(grid_surface, CRT_SCANLINE_SPACING, CRT_SCANLINE_ALPHA)
+        overlays.append(grid_surface)
+    if overlays:
+        backend.add_overlay(flatten_overlays(overlays, (total_width, total_height)))
 
     # --- ADAPTIVE QUALITY STATE ---
-    ripples_enabled_runtime = ripples_enabled_startup
-    cascades_enabled_runtime = cascades_enabled_startup
-    fps_history = [FRAME_RATE] * 20
+    ripples_enabled_runtime = cfg.ripples_enabled
+    cascades_enabled_runtime = cfg.cascades_enabled
+    # Ring buffer of recent FPS samples with a running sum, so the average is O(1) per frame
+    fps_history = deque([frame_rate] * 20, maxlen=20)
+    fps_sum = float(frame_rate * 20)
+
+    # The FPS caption only shows in a normal window; wallpapers and screensavers have no title bar
+    show_fps_caption = not (is_screensaver_mode or is_wallpaper_arg or cfg.wallpaper_mode)
+    caption_timer = 0.0
+
+    # A timer event paces the frames; the loop sleeps in event.wait() until it (or input) arrives
+    frame_event = pygame.event.custom_type()
+    pygame.time.set_timer(frame_event, max(1, round(1000 / frame_rate)))
+
+    # Only queue the events the loop acts on; mouse motion matters only to the screensaver
+    handled_events = [frame_event, pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
+    if is_screensaver_mode:
+        handled_events.append(pygame.MOUSEMOTION)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(handled_events)
+    motion_x = motion_y = 0  # Screensaver: mouse travel since the last frame
 
     running = True
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        frame_due = False
+        for event in [pygame.event.wait(), *pygame.event.get()]:
+            if event.type == frame_event:
+                frame_due = True
+            elif event.type == pygame.QUIT:
                 running = False
             
             # --- SCREENSAVER EXIT LOGIC ---
@@ -972,25 +2086,32 @@ def main():
                     # Exit on any key or click
                     running = False 
                 elif event.type == pygame.MOUSEMOTION:
-                    # Check for significant mouse movement to avoid jitter exits
-                    if abs(event.rel[0]) > 5 or abs(event.rel[1]) > 5:
-                        running = False
+                    # Summed here, checked once per frame below
+                    motion_x += event.rel[0]
+                    motion_y += event.rel[1]
             else:
                  # Normal exit logic
                  if event.type in [pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]:
                     if getattr(event, 'key', None) in [pygame.K_ESCAPE, pygame.K_q]:
                         running = False
 
-        delta_time_s = clock.tick(FRAME_RATE) / 1000.0
+        if not frame_due or not running:
+            continue
+        # Check for significant mouse movement to avoid jitter exits
+        if abs(motion_x) > 5 or abs(motion_y) > 5:
+            running = False
+            continue
+        motion_x = motion_y = 0
+        delta_time_s = clock.tick() / 1000.0
         
         # --- ADAPTIVE QUALITY LOGIC ---
         current_fps = clock.get_fps()
         if current_fps > 0: # Avoid division by zero if paused
-            fps_history.pop(0)
+            fps_sum += current_fps - fps_history[0]
             fps_history.append(current_fps)
-            avg_fps = sum(fps_history) / len(fps_history)
+            avg_fps = fps_sum / len(fps_history)
 
-            if avg_fps < ADAPTIVE_THRESHOLD:
+            if avg_fps < adaptive_threshold:
                 if ripples_enabled_runtime:
                     ripples_enabled_runtime = False
                     print(f"Performance low (Avg FPS: {avg_fps:.1f}), disabling ripples.")
@@ -998,28 +2119,27 @@ def main():
                     cascades_enabled_runtime = False
                     print(f"Performance low (Avg FPS: {avg_fps:.1f}), disabling cascades.")
         
-        screen.fill(BACKGROUND_COLOR)
-        drawing_surface.fill((0, 0, 0, 0))
+        backend.begin_frame(background_color)
 
-        active_ripples = ripple_manager.get_active_ripples() if ripples_enabled_runtime else []
+        if ripples_enabled_runtime:
+            ripples, ripple_luts, ripple_buckets = ripple_manager.get_ripple_arrays()
+        else:
+            ripples, ripple_luts, ripple_buckets = NO_RIPPLES, NO_RIPPLE_LUTS, NO_RIPPLE_BUCKETS
 
         for layer in column_layers:
-            for column in layer:
-                column.update_and_draw(drawing_surface, delta_time_s, active_ripples)
+            layer.update_and_draw(backend, delta_time_s, ripples, ripple_luts, ripple_buckets)
 
         if cascades_enabled_runtime:
             cascade_manager.update(delta_time_s)
         if ripples_enabled_runtime:
             ripple_manager.update(delta_time_s)
-        
-        screen.blit(drawing_surface, (0, 0))
-        if HAZE_ENABLED:
-            screen.blit(haze_surface, (0, 0))
-        if CRT_GRID_ENABLED:
-            screen.blit(grid_surface, (0,0))
-            
-        pygame.display.set_caption(f"Matrix Rain FX (FPS: {clock.get_fps():.2f})")
-        pygame.display.flip()
+
+        if show_fps_caption:
+            caption_timer += delta_time_s
+            if caption_timer >= FPS_CAPTION_INTERVAL_S:
+                caption_timer = 0.0
+                backend.set_caption(f"Matrix Rain FX (FPS: {clock.get_fps():.2f})")
+        backend.end_frame()
 
     pygame.quit()
     sys.exit()
@@ -11,13 +11,27 @@ import sys
 import os
 import signal
 import time
+import select
+import socket
+from functools import lru_cache
 
 # Get the directory where this script is located
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 MATRIX_RAIN_SCRIPT = os.path.join(SCRIPT_DIR, "matrix_rain.py")
 
+# --single-process: one matrix_rain.py process with a window per display (matrix_rain.py --displays)
+# instead of one process per display, so pygame, PyObjC and the glyph caches are loaded once
+SINGLE_PROCESS = "--single-process" in sys.argv
+
+# How long to wait for a display's process to report its window in place before starting the next
+READY_TIMEOUT_S = 3.0
+
+@lru_cache(maxsize=1)
 def get_num_displays():
-    """Get the number of connected displays using PyObjC (more reliable than pygame for this)."""
+    """
+    Get the number of connected displays using PyObjC (more reliable than pygame for this).
+    Cached for the life of the process; call get_num_displays.cache_clear() to re-query.
+    """
     try:
         from AppKit import NSScreen
         return len(NSScreen.screens())
@@ -25,6 +39,20 @@ def get_num_displays():
         print(f"Error getting display count: {e}")
         return 1
 
+def launch_and_wait_ready(cmd):
+    """
+    Start cmd with a --ready-fd socket and wait (up to READY_TIMEOUT_S) until the child
+    reports its window placed, or exits. Returns the Popen.
+    """
+    parent_sock, child_sock = socket.socketpair()
+    with parent_sock, child_sock:
+        proc = subprocess.Popen(cmd + ["--ready-fd", str(child_sock.fileno())], pass_fds=(child_sock.fileno(),))
+        child_sock.close()
+        # Readable on the child's message, or on EOF if it died first
+        if not select.select([parent_sock], [], [], READY_TIMEOUT_S)[0]:
+            print(f"  No ready signal after {READY_TIMEOUT_S:.0f}s, continuing")
+    return proc
+
 def launch_wallpapers():
     """Launch a wallpaper process for each display."""
     num_displays = get_num_displays()
@@ -32,21 +60,29 @@ def launch_wallpapers():
     
     processes = []
     
-    # Launch in REVERSE order - secondary displays first, primary (0) last
-    # This helps avoid conflicts where display 0 takes over rendering
-    for display_index in reversed(range(num_displays)):
-        # Launch matrix_rain.py with --wallpaper and --display arguments
+    if SINGLE_PROCESS:
         cmd = [
             sys.executable,
             MATRIX_RAIN_SCRIPT,
             "--wallpaper",
-            "--display", str(display_index)
+            "--displays", "all"
         ]
-        print(f"  Starting on display {display_index}: {' '.join(cmd)}")
-        proc = subprocess.Popen(cmd)
-        processes.append(proc)
-        # Delay between launches to prevent race conditions
-        time.sleep(1.0)
+        print(f"  Starting one process for all displays: {' '.join(cmd)}")
+        processes.append(subprocess.Popen(cmd))
+    else:
+        # Launch in REVERSE order - secondary displays first, primary (0) last
+        # This helps avoid conflicts where display 0 takes over rendering
+        for display_index in reversed(range(num_displays)):
+            # Launch matrix_rain.py with --wallpaper and --display arguments
+            cmd = [
+                sys.executable,
+                MATRIX_RAIN_SCRIPT,
+                "--wallpaper",
+                "--display", str(display_index)
+            ]
+            print(f"  Starting on display {display_index}: {' '.join(cmd)}")
+            # Wait for each window to be placed before starting the next, to prevent race conditions
+            processes.append(launch_and_wait_ready(cmd))
     
     print("Wallpapers running on all displays.")
     print("To stop: run 'pkill -f \"matrix_rain.py --wallpaper\"' or use Activity Monitor")
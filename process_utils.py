@@ -0,0 +1,33 @@
+"""
+Process listing shared by the screensaver watcher and the wallpaper manager.
+"""
+
+import os
+import subprocess
+
+# psutil is optional; without it, a single `ps` snapshot per poll stands in
+try:
+    import psutil
+    _HAS_PSUTIL = True
+except ImportError:
+    _HAS_PSUTIL = False
+
+def get_process_commands():
+    """
+    Returns (pid, command line) for every running process other than this one,
+    from one psutil scan or, without psutil, one `ps` snapshot.
+    """
+    own_pid = os.getpid()
+    commands = []
+    if _HAS_PSUTIL:
+        for proc in psutil.process_iter(['pid', 'cmdline']):
+            cmdline = proc.info['cmdline']
+            if cmdline and proc.info['pid'] != own_pid:
+                commands.append((proc.info['pid'], ' '.join(cmdline)))
+        return commands
+    output = subprocess.check_output(["ps", "-axo", "pid=,command="]).decode(errors='replace')
+    for line in output.splitlines():
+        pid, _, command = line.strip().partition(' ')
+        if pid.isdigit() and int(pid) != own_pid:
+            commands.append((int(pid), command))
+    return commands
@@ -4,6 +4,15 @@ import os
 import sys
 import configparser
 
+from process_utils import get_process_commands
+
+# Quartz (PyObjC) reads the HID idle time in-process; without it, fall back to ioreg
+try:
+    from Quartz import CGEventSourceSecondsSinceLastEventType, kCGEventSourceStateHIDSystemState, kCGAnyInputEventType
+    _HAS_QUARTZ = True
+except ImportError:
+    _HAS_QUARTZ = False
+
 # --- CONFIG ---
 CHECK_INTERVAL = 5            # Check every 5 seconds
 LAUNCHER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multi_display_launcher.py")
@@ -18,7 +27,12 @@ else:
     PYTHON_EXEC = sys.executable
 
 def get_idle_time():
-    """Returns macOS idle time in seconds using ioreg."""
+    """Returns macOS idle time in seconds, from Quartz or (without PyObjC) ioreg."""
+    if _HAS_QUARTZ:
+        try:
+            return CGEventSourceSecondsSinceLastEventType(kCGEventSourceStateHIDSystemState, kCGAnyInputEventType)
+        except Exception:
+            pass
     try:
         cmd = "ioreg -c IOHIDSystem | awk '/HIDIdleTime/ {print $NF/1000000000; exit}'"
         result = subprocess.check_output(cmd, shell=True)
@@ -29,10 +43,8 @@ def get_idle_time():
 def is_running(script_name):
     """Checks if the script is already running."""
     try:
-        # Check for python process running matrix_rain.py
-        subprocess.check_output(f"pgrep -f '{script_name}'", shell=True)
-        return True
-    except subprocess.CalledProcessError:
+        return any(script_name in command for _, command in get_process_commands())
+    except Exception:
         return False
 
 def load_config():
@@ -4,6 +4,8 @@ import os
 import sys
 import signal
 
+from process_utils import get_process_commands
+
 # --- CONFIG ---
 CHECK_INTERVAL = 10  # Check power status every 10 seconds
 LAUNCHER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "multi_display_wallpaper.py")
@@ -24,35 +26,13 @@ def get_wallpaper_pids():
     """Finds all PIDs of matrix wallpaper processes (NOT screensaver)."""
     pids = []
     try:
-        # Check for multi_display_wallpaper.py launcher
-        try:
-            launcher_pids = subprocess.check_output(["pgrep", "-f", "multi_display_wallpaper.py"]).decode().strip().split('\n')
-            pids.extend([int(p) for p in launcher_pids if p])
-        except subprocess.CalledProcessError:
-            pass
-        
-        # Check for matrix_rain.py with --wallpaper flag
-        try:
-            cmd = ["pgrep", "-f", "matrix_rain.py.*--wallpaper"]
-            wallpaper_pids = subprocess.check_output(cmd).decode().strip().split('\n')
-            pids.extend([int(p) for p in wallpaper_pids if p])
-        except subprocess.CalledProcessError:
-            pass
-        
-        # Also check for old-style wallpaper (matrix_rain.py without --screensaver and without --wallpaper)
-        # This maintains backward compatibility
-        try:
-            all_pids = subprocess.check_output(["pgrep", "-f", "matrix_rain.py"]).decode().strip().split('\n')
-            for pid in all_pids:
-                if not pid: continue
-                try:
-                    args = subprocess.check_output(["ps", "-p", pid, "-o", "command="]).decode()
-                    if "matrix_rain.py" in args and "--screensaver" not in args and int(pid) not in pids:
-                        pids.append(int(pid))
-                except:
-                    continue
-        except subprocess.CalledProcessError:
-            pass
+        for pid, command in get_process_commands():
+            # The multi_display_wallpaper.py launcher, and matrix_rain.py run as a wallpaper:
+            # with --wallpaper, or old-style with neither flag (kept for backward compatibility)
+            if "multi_display_wallpaper.py" in command:
+                pids.append(pid)
+            elif "matrix_rain.py" in command and "--screensaver" not in command:
+                pids.append(pid)
     except Exception:
         pass
     return pids if pids else None